@@ -1,59 +0,0 @@
-"""
-Setup script for WebApp Manager
-"""
-
-from setuptools import setup, find_packages
-
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
-
-setup(
-    name="webapp-manager",
-    version="3.0.0",
-    author="WebApp Manager Team",
-    author_email="admin@webapp-manager.com",
-    description="Sistema modular de gestión de aplicaciones web con nginx proxy reverso",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/username/webapp-manager",
-    packages=find_packages(),
-    classifiers=[
-        "Development Status :: 5 - Production/Stable",
-        "Intended Audience :: Developers",
-        "Intended Audience :: System Administrators",
-        "License :: OSI Approved :: MIT License",
-        "Operating System :: POSIX :: Linux",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Topic :: Internet :: WWW/HTTP :: HTTP Servers",
-        "Topic :: System :: Installation/Setup",
-        "Topic :: System :: Systems Administration",
-    ],
-    python_requires=">=3.8",
-    install_requires=[
-        "rich>=13.0.0",
-    ],
-    extras_require={
-        "dev": [
-            "pytest>=7.0.0",
-            "pytest-cov>=4.0.0",
-            "black>=22.0.0",
-            "flake8>=5.0.0",
-            "mypy>=0.991",
-        ],
-    },
-    entry_points={
-        "console_scripts": [
-            "webapp-manager=webapp_manager.cli:main",
-        ],
-    },
-    scripts=["webapp-manager.py"],
-    include_package_data=True,
-    package_data={
-        '': ['apps/maintenance/*.html'],
-    },
-    zip_safe=False,
-)
@@ -6,11 +6,10 @@ Optimizado para servidores Linux con interfaz gráfica terminal
 """
 
 import sys
-import os
-
-# Agregar el directorio actual al path para imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Python ya antepone el directorio (real) de este script a sys.path, por lo
+# que el paquete webapp_manager se importa sin manipular el path. Instalado
+# con pip, el comando webapp-manager usa el entry point webapp_manager.cli:main.
 from webapp_manager.cli import CLI
 
 def main():
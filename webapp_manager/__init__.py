@@ -3,12 +3,39 @@ WebApp Manager - Sistema completo de gestión de aplicaciones web
 Versión 4.0 - Arquitectura modular y escalable para Linux
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 __version__ = "4.0.0"
 __description__ = "Sistema completo de gestión de aplicaciones web con nginx proxy reverso"
 __author__ = "WebApp Manager Team"
 
-from .core.manager import WebAppManager
-from .models.app_config import AppConfig
-from .utils.colors import Colors
-
 __all__ = ['WebAppManager', 'AppConfig', 'Colors']
+
+# Los símbolos públicos se importan bajo demanda: importar el paquete (por
+# ejemplo para leer __version__ o cargar webapp_manager.cli) no debe
+# arrastrar core.manager, que configura logging y crea directorios.
+_LAZY_ATTRS = {
+    'WebAppManager': '.core.manager',
+    'AppConfig': '.models.app_config',
+    'Colors': '.utils.colors',
+}
+
+if TYPE_CHECKING:
+    from .core.manager import WebAppManager
+    from .models.app_config import AppConfig
+    from .utils.colors import Colors
+
+
+def __getattr__(name: str):
+    """Importar perezosamente los símbolos públicos del paquete"""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
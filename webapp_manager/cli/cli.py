@@ -4,46 +4,333 @@ Diseñada para ser 100% terminal con Rich para experiencia profesional
 """
 
 import argparse
+import math
 import os
+import re
+import shutil
 import sys
-import time
-from typing import Dict, List, Optional, Any
-from contextlib import contextmanager
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import (
-    Progress, 
-    BarColumn, 
-    TextColumn, 
-    TimeElapsedColumn, 
-    TimeRemainingColumn,
-    SpinnerColumn,
-    MofNCompleteColumn,
-    TaskProgressColumn
-)
-from rich.prompt import Prompt, Confirm
-from rich.syntax import Syntax
 from rich.text import Text
-from rich.live import Live
-from rich.layout import Layout
-from rich.align import Align
-from rich.columns import Columns
-from rich.status import Status
 
-from ..utils import Colors, Validators, ProgressManager
-from ..core.manager import WebAppManager
-from ..deployers import DeployerFactory
+from ..utils import ProgressManager
+
+# Datos del proceso que no cambian durante la ejecución
+_IS_POSIX = os.name == 'posix'
+_IS_ROOT = _IS_POSIX and os.geteuid() == 0
+_PYTHON_VERSION = "{}.{}.{}".format(*sys.version_info[:3])
+_MACHINE = os.uname().machine if hasattr(os, 'uname') else 'N/A'
+
+# Etiquetas de estilo de Rich usadas en los mensajes de la CLI
+_MARKUP_TAG_RE = re.compile(
+    r"\[/?(?:bold|dim|red|green|yellow|blue|cyan|magenta|white|link)(?: [a-z]+)*\]"
+)
+
+# --env KEY=VALUE con las mismas reglas que Validators.validate_env_var:
+# clave en mayúsculas, espacios alrededor de clave y valor descartados
+_ENV_VAR_RE = re.compile(r"\s*([A-Z_][A-Z0-9_]*)\s*=\s*(.*?)\s*", re.DOTALL)
+
+# Tipo de aplicación usado por 'add' cuando no se indica --type
+DEFAULT_APP_TYPE = "nextjs"
+
+# Comandos que no usan WebAppManager: no se importa ni se inicializa y no
+# requieren root (el manager crea directorios del sistema y lee la
+# configuración, que solo es legible por root)
+_NO_MANAGER_COMMANDS = {"types", "detect", "version", "gui"}
+
+# Comandos que operan sobre una aplicación y necesitan --domain
+_DOMAIN_COMMANDS = {
+    "remove", "restart", "update", "logs", "ssl", "repair", "maintenance", "updating"
+}
+
+# Comandos que aceptan varios dominios en --domain (a,b,c); el resto, uno solo
+_MULTI_DOMAIN_COMMANDS = {"restart", "update", "repair", "logs"}
+
+# Comando -> (método de CLI que lo ejecuta, título mostrado en modo verbose)
+COMMANDS = {
+    "add": ("_cmd_add", "Agregar Aplicación"),
+    "remove": ("_cmd_remove", "Eliminar Aplicación"),
+    "list": ("_cmd_list", "Listar Aplicaciones"),
+    "restart": ("_cmd_restart", "Reiniciar Aplicación"),
+    "update": ("_cmd_update", "Actualizar Aplicación"),
+    "logs": ("_cmd_logs", "Ver Logs"),
+    "ssl": ("_cmd_ssl", "Configurar SSL"),
+    "diagnose": ("_cmd_diagnose", "Diagnóstico"),
+    "repair": ("_cmd_repair", "Reparar Aplicación"),
+    "status": ("_cmd_status", "Estado"),
+    "export": ("_cmd_export", "Exportar Configuración"),
+    "import": ("_cmd_import", "Importar Configuración"),
+    "types": ("_cmd_types", "Tipos de Aplicación"),
+    "detect": ("_cmd_detect", "Detectar Tipo"),
+    "fix-config": ("_cmd_fix_config", "Reparar Configuración"),
+    "apply-maintenance": ("_cmd_apply_maintenance", "Aplicar Páginas de Mantenimiento"),
+    "maintenance": ("_cmd_maintenance", "Modo Mantenimiento"),
+    "updating": ("_cmd_updating", "Modo Actualización"),
+    "sync-pages": ("_cmd_sync_pages", "Sincronizar Páginas"),
+    "setup": ("_cmd_setup", "Configuración Inicial"),
+    "check-system": ("_cmd_check_system", "Verificar Prerequisitos del Sistema"),
+    "version": ("_cmd_version", "Información de Versión"),
+    "gui": ("_cmd_gui", "Interfaz Gráfica"),
+}
+
+
+# Textos estáticos de la interfaz, construidos una sola vez
+_BANNER_TEXT = """
+    ╔══════════════════════════════════════════════════════════════════╗
+    ║                                                                  ║
+    ║               🚀 WebApp Manager v4.0                            ║
+    ║            Sistema Modular para Aplicaciones Web                 ║
+    ║                                                                  ║
+    ╚══════════════════════════════════════════════════════════════════╝
+""".strip()
+
+_QUICK_HELP_TEXT = """
+[bold cyan]Comandos Principales:[/bold cyan]
+
+[bold]Gestión de Aplicaciones:[/bold]
+  • [green]webapp-manager list[/green]                    - Listar aplicaciones
+  • [green]webapp-manager add[/green] --domain app.com     - Agregar aplicación
+  • [green]webapp-manager remove[/green] --domain app.com  - Eliminar aplicación
+  • [green]webapp-manager update[/green] --domain app.com  - Actualizar aplicación
+  • [green]webapp-manager restart[/green] --domain app.com - Reiniciar aplicación
+
+[bold]Monitoreo y Diagnóstico:[/bold]
+  • [green]webapp-manager status[/green]                   - Estado del sistema
+  • [green]webapp-manager logs[/green] --domain app.com    - Ver logs
+  • [green]webapp-manager diagnose[/green]                 - Diagnóstico completo
+
+[bold]Herramientas:[/bold]
+  • [green]webapp-manager types[/green]                    - Tipos de aplicación
+  • [green]webapp-manager detect[/green] --directory ./app - Detectar tipo
+
+[bold]Opciones:[/bold]
+  • [yellow]--verbose, -v[/yellow]                           - Mostrar logs detallados
+
+[bold]Ejemplos Rápidos:[/bold]
+  • [dim]webapp-manager add --domain mi-app.com --source https://github.com/user/app.git --port 3000[/dim]
+  • [dim]webapp-manager list --detailed[/dim]
+  • [dim]webapp-manager logs --domain mi-app.com --follow[/dim]
+
+Para ayuda detallada: [bold]webapp-manager --help[/bold]
+""".strip()
+
+_EXAMPLES_EPILOG = """
+[bold cyan]Ejemplos de Uso:[/bold cyan]
+
+[bold]� Configuración Inicial (Primera vez):[/bold]
+  webapp-manager setup
+  
+[bold]�📱 Aplicaciones Next.js:[/bold]
+  webapp-manager add --domain app.ejemplo.com --source /ruta/app --port 3000
+  webapp-manager add --domain mi-app.com --source https://github.com/usuario/mi-app.git --port 3001
+  
+[bold]🐍 APIs FastAPI:[/bold]
+  webapp-manager add --domain api.ejemplo.com --source /ruta/api --port 8000 --type fastapi
+  webapp-manager add --domain mi-api.com --source https://github.com/usuario/mi-api.git --port 8001 --type fastapi
+  
+[bold]🟢 Aplicaciones Node.js:[/bold]
+  webapp-manager add --domain node-app.com --source https://github.com/usuario/node-app.git --port 4000 --type nodejs
+  
+[bold]📄 Sitios Estáticos:[/bold]
+  webapp-manager add --domain sitio.com --source /ruta/sitio --type static
+
+[bold]🔍 Modo Verbose:[/bold]
+  webapp-manager add --domain app.com --source ./app --port 3000 --verbose
+  webapp-manager update --domain app.com -v
+  
+[bold]📊 Gestión y Monitoreo:[/bold]
+  webapp-manager list --detailed
+  webapp-manager status --domain mi-app.com
+  webapp-manager logs --domain mi-app.com --lines 100 --follow
+  webapp-manager diagnose --domain mi-app.com
+  webapp-manager restart --domain api.ejemplo.com
+  webapp-manager restart --domain app.ejemplo.com,api.ejemplo.com
+  
+[bold]🔧 Herramientas Avanzadas:[/bold]
+  webapp-manager types
+  webapp-manager detect --directory /ruta/app
+  webapp-manager export --file backup-config.json
+  webapp-manager ssl --domain app.ejemplo.com --email admin@ejemplo.com
+  webapp-manager apply-maintenance   # Aplicar páginas de mantenimiento a apps existentes
+  webapp-manager check-system        # Verificar prerequisitos del sistema
+
+[bold]🛠️  Modo Mantenimiento y Actualización:[/bold]
+  # Modo interactivo (pregunta si activar/desactivar)
+  webapp-manager maintenance --domain app.com
+  webapp-manager updating --domain app.com
+  
+  # Activar explícitamente
+  webapp-manager maintenance --domain app.com --enable
+  webapp-manager updating --domain app.com --enable
+  
+  # Desactivar explícitamente  
+  webapp-manager maintenance --domain app.com --disable
+  webapp-manager updating --domain app.com --disable
+  
+  # Sincronizar páginas HTML
+  webapp-manager sync-pages
+
+[bold]Tipos de aplicación soportados:[/bold]
+  • [green]nextjs[/green]  - Aplicaciones Next.js (por defecto)
+  • [green]nodejs[/green]  - Aplicaciones Node.js genéricas  
+  • [green]fastapi[/green] - APIs FastAPI con Python
+  • [green]static[/green]  - Sitios web estáticos
+
+[bold]Variables de entorno:[/bold]
+  --env NODE_ENV=production --env API_KEY=abc123 --env DATABASE_URL=postgresql://...
+"""
+
+# Estado crudo de systemd -> texto mostrado en 'list'
+_LIST_STATUS_DISPLAY = {
+    "active": "[green]🟢 Activo[/green]",
+    "inactive": "[yellow]🟡 Inactivo[/yellow]",
+    "failed": "[red]🔴 Fallido[/red]",
+}
+_LIST_STATUS_UNKNOWN = "[dim]🔘 Desconocido[/dim]"
+
+# Estado crudo de systemd -> (estado, detalles) mostrados en 'status --domain'
+_APP_STATUS_DISPLAY = {
+    "active": ("[green]🟢 Funcionando[/green]", "Servicio systemd activo"),
+    "inactive": ("[yellow]🟡 Detenido[/yellow]", "Servicio systemd inactivo"),
+}
+_APP_STATUS_ERROR = ("[red]🔴 Error[/red]", "Problema con el servicio")
+
+# Fila SSL de 'status --domain'
+_SSL_ROW_ON = ("🔒 SSL", "[green]🔒 Configurado[/green]", "HTTPS habilitado")
+_SSL_ROW_OFF = ("🔒 SSL", "[yellow]🔓 Sin SSL[/yellow]", "Solo HTTP")
+
+# Paneles con contenido fijo, construidos una sola vez
+_NO_APPS_PANEL = Panel(
+    "[yellow]No hay aplicaciones desplegadas[/yellow]\n\n"
+    "Para desplegar tu primera aplicación:\n"
+    "[cyan]webapp-manager add --domain ejemplo.com --source /ruta --port 3000[/cyan]",
+    title="Sin Aplicaciones",
+    border_style="yellow"
+)
+
+_TYPE_EXAMPLES_PANEL = Panel(
+    """[bold]Ejemplos de uso por tipo:[/bold]
+
+[cyan]nextjs[/cyan]:  webapp-manager add --domain app.com --source ./my-nextjs-app --port 3000 --type nextjs
+[cyan]fastapi[/cyan]: webapp-manager add --domain api.com --source ./my-fastapi-api --port 8000 --type fastapi  
+[cyan]nodejs[/cyan]:  webapp-manager add --domain node.com --source ./my-node-app --port 5000 --type nodejs
+[cyan]static[/cyan]:  webapp-manager add --domain site.com --source ./my-static-site --type static
+    """,
+    title="Ejemplos",
+    border_style="blue"
+)
+
+_APPLY_MAINTENANCE_INFO_PANEL = Panel(
+    "[bold cyan]Aplicar Páginas de Mantenimiento[/bold cyan]\n\n"
+    "Este comando actualiza las configuraciones de nginx existentes para incluir:\n"
+    "• Redirección automática a páginas de mantenimiento en errores 502/503/504\n"
+    "• Páginas profesionales y modernas de actualización y error\n"
+    "• Configuración automática para todas las aplicaciones\n\n"
+    "[dim]Las páginas se sirven desde /apps/maintenance/ y se actualizan cada 30 segundos[/dim]",
+    title="ℹ️  Información",
+    style="blue"
+)
+
+_APPLY_MAINTENANCE_DONE_PANEL = Panel(
+    "[bold green]✅ Configuración aplicada exitosamente[/bold green]\n\n"
+    "Las aplicaciones ahora mostrarán automáticamente páginas de mantenimiento cuando:\n"
+    "• El servicio esté caído (error 502/503/504)\n"
+    "• Se esté realizando una actualización\n"
+    "• Ocurra un error interno del servidor (error 500)\n\n"
+    "[dim]Las páginas se actualizan automáticamente cada 30 segundos[/dim]",
+    title="🎉 Completado",
+    style="green"
+)
+
+_SETUP_INFO_PANEL = Panel(
+    "[bold cyan]Configuración Inicial del Sistema[/bold cyan]\n\n"
+    "Este comando realizará las siguientes tareas:\n\n"
+    "• ✅ Verificar requisitos del sistema (nginx, python3, systemctl)\n"
+    "• 📄 Instalar páginas de mantenimiento en /apps/maintenance/\n"
+    "• 🔍 Verificar conflictos con el sitio default de nginx\n"
+    "• 🔧 Configurar directorios necesarios\n\n"
+    "[dim]Este comando debe ejecutarse una vez después de instalar webapp-manager[/dim]\n"
+    "[yellow]⚠️  Se requieren permisos de root (sudo)[/yellow]",
+    title="ℹ️  Información de Setup",
+    style="blue"
+)
+
+_SETUP_DONE_PANEL = Panel(
+    "[bold green]✅ Configuración inicial completada exitosamente[/bold green]\n\n"
+    "El sistema está listo para usar. Puedes:\n\n"
+    "• Agregar tu primera aplicación:\n"
+    "  [cyan]webapp-manager add --domain app.com --source /path --port 3000[/cyan]\n\n"
+    "• Ver aplicaciones instaladas:\n"
+    "  [cyan]webapp-manager list[/cyan]\n\n"
+    "• Ver tipos de aplicaciones soportados:\n"
+    "  [cyan]webapp-manager types[/cyan]\n\n"
+    "[dim]Las páginas de mantenimiento se han instalado en /apps/maintenance/[/dim]",
+    title="🎉 Setup Completado",
+    style="green"
+)
+
+_CHECK_SYSTEM_PANEL = Panel(
+    "[bold cyan]Verificación de Prerequisitos del Sistema[/bold cyan]\n\n"
+    "Verificando la instalación de herramientas requeridas...",
+    title="🔍 Check System",
+    style="blue"
+)
+
+_SYNC_PAGES_INFO_PANEL = Panel(
+    "[bold cyan]Sincronizar Páginas de Mantenimiento[/bold cyan]\n\n"
+    "Este comando actualiza las páginas HTML de mantenimiento en el servidor\n"
+    "copiándolas desde el repositorio a /apps/maintenance/\n\n"
+    "Páginas incluidas:\n"
+    "• [green]maintenance.html[/green] - Página de mantenimiento programado\n"
+    "• [green]updating.html[/green] - Página de actualización en progreso\n"
+    "• [green]error502.html[/green] - Página de error del servidor\n\n"
+    "[dim]Usa este comando después de actualizar webapp-manager para obtener\n"
+    "las últimas versiones de las páginas[/dim]",
+    title="ℹ️  Información",
+    style="blue"
+)
+
+_SYNC_PAGES_DONE_PANEL = Panel(
+    "[bold green]✅ Páginas de mantenimiento actualizadas[/bold green]\n\n"
+    "Las páginas HTML se han copiado a /apps/maintenance/\n\n"
+    "Ahora puedes:\n"
+    "• Activar modo mantenimiento:\n"
+    "  [cyan]webapp-manager maintenance --domain app.com[/cyan]\n\n"
+    "• Activar modo actualización:\n"
+    "  [cyan]webapp-manager updating --domain app.com[/cyan]\n\n"
+    "[dim]Las páginas se sirven automáticamente cuando hay errores 502/503/504[/dim]",
+    title="🎉 Completado",
+    style="green"
+)
+
+
+class _AppendInPlace(argparse.Action):
+    """Como action="append" pero sin copiar la lista en cada aparición"""
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        items = getattr(namespace, self.dest, None)
+        if items is None:
+            # Lista nueva por ejecución: nunca se modifica un default compartido
+            items = []
+            setattr(namespace, self.dest, items)
+        items.append(values)
 
 
 class CLI:
     """Interfaz de línea de comandos moderna con Rich"""
     
     def __init__(self):
-        self.console = Console()
+        # Sin terminal (tuberías, CI, cron) Rich no emite colores: se
+        # desactiva el resaltado y los mensajes simples se escriben en texto plano
+        self.plain_output = not sys.stdout.isatty()
+        self.console = Console(highlight=not self.plain_output)
         self.manager = None
         self.verbose = False
+        self.assume_yes = False
         self.progress_manager = None
         
         # Configurar estilo de la consola
@@ -57,79 +344,90 @@ class CLI:
             self._show_interactive_help()
             return
         
+        # 'version' no necesita parser, permisos ni manager
+        if sys.argv[1:] == ["version"]:
+            self._cmd_version()
+            return
+        
         parser = self._create_parser()
         args = parser.parse_args()
         
-        # Configurar modo verbose
+        # Configurar modo verbose y confirmaciones automáticas
         self.verbose = args.verbose
+        self.assume_yes = args.yes
         
         # Crear progress manager
         self.progress_manager = ProgressManager(self.console, verbose=self.verbose)
         
-        # Verificar permisos de root (solo en sistemas Unix)
-        if os.name == 'posix' and os.geteuid() != 0:
-            self._show_error("Este script requiere permisos de root en sistemas Unix")
-            self._show_info(f"Ejecuta: [bold]sudo {' '.join(sys.argv)}[/bold]")
-            sys.exit(1)
-        
-        # Inicializar manager
-        try:
-            with self.progress_manager.task("Inicializando WebApp Manager", total=3) as task_id:
-                self.progress_manager.update(task_id, advance=1, description="Cargando configuración...")
-                self.manager = WebAppManager(verbose=self.verbose, progress_manager=self.progress_manager)
-                self.progress_manager.update(task_id, advance=1, description="Verificando servicios...")
-                time.sleep(0.3)  # Simular verificación
-                self.progress_manager.update(task_id, advance=1, description="Sistema listo")
-        except Exception as e:
-            self._show_error(f"Error inicializando WebApp Manager: {e}")
-            sys.exit(1)
+        # Validar argumentos antes de pedir root e inicializar el manager
+        if args.command in _DOMAIN_COMMANDS and not args.domain:
+            self._exit_with_error("Necesitas especificar --domain")
+        if args.domain and "," in args.domain and args.command not in _MULTI_DOMAIN_COMMANDS:
+            self._exit_with_error(
+                f"'{args.command}' admite un solo dominio en --domain "
+                f"(varios separados por comas solo en: {', '.join(sorted(_MULTI_DOMAIN_COMMANDS))})"
+            )
         
-        # Procesar variables de entorno
-        env_vars = self._parse_env_vars(args.env or [])
+        if args.command not in _NO_MANAGER_COMMANDS:
+            # Verificar permisos de root (solo en sistemas Unix)
+            if _IS_POSIX and not _IS_ROOT:
+                self._exit_with_error(
+                    "Este script requiere permisos de root en sistemas Unix",
+                    lambda: f"Ejecuta: [bold]sudo {' '.join(sys.argv)}[/bold]"
+                )
+            
+            # Inicializar manager (core.manager configura logging al importarse)
+            from ..core.manager import WebAppManager
+            
+            try:
+                with self._loading("Inicializando WebApp Manager"):
+                    self.manager = WebAppManager(verbose=self.verbose, progress_manager=self.progress_manager)
+            except Exception as e:
+                self._exit_with_error(f"Error inicializando WebApp Manager: {e}")
         
         # Ejecutar comando
         try:
-            success = self._execute_command(args, env_vars)
+            success = self._execute_command(args)
             
             # Limpiar progreso antes de salir
-            if hasattr(self, 'progress_manager') and self.progress_manager:
-                self.progress_manager.stop()
+            self._cleanup_progress()
             
             sys.exit(0 if success else 1)
         except KeyboardInterrupt:
             self._show_warning("\n⚠️  Operación cancelada por el usuario")
             
             # Limpiar progreso en caso de interrupción
-            if hasattr(self, 'progress_manager') and self.progress_manager:
-                self.progress_manager.force_cleanup()
+            self._cleanup_progress(force=True)
             
             sys.exit(1)
         except Exception as e:
             self._show_error(f"Error inesperado: {e}")
             
             # Limpiar progreso en caso de error
-            if hasattr(self, 'progress_manager') and self.progress_manager:
-                self.progress_manager.force_cleanup()
+            self._cleanup_progress(force=True)
             
             if self.verbose:
+                # traceback se importa aquí y no a nivel de módulo: solo se
+                # necesita al mostrar un error en modo verbose
                 import traceback
                 self.console.print(f"[dim]Detalles del error:\n{traceback.format_exc()}[/dim]")
             
             sys.exit(1)
     
+    def _cleanup_progress(self, force: bool = False):
+        """Detener el progreso (forzando la limpieza tras un error)"""
+        if self.progress_manager is not None:
+            if force:
+                self.progress_manager.force_cleanup()
+            else:
+                self.progress_manager.stop()
+    
     def _show_banner(self):
         """Mostrar banner de la aplicación"""
-        banner_text = """
-    ╔══════════════════════════════════════════════════════════════════╗
-    ║                                                                  ║
-    ║               🚀 WebApp Manager v4.0                            ║
-    ║            Sistema Modular para Aplicaciones Web                 ║
-    ║                                                                  ║
-    ╚══════════════════════════════════════════════════════════════════╝
-        """
+        from rich.align import Align
         
         self.console.print(Panel(
-            Align.center(banner_text.strip()),
+            Align.center(_BANNER_TEXT),
             style="bold blue",
             padding=(1, 2)
         ))
@@ -147,9 +445,9 @@ class CLI:
             
             # Verificar servicios básicos
             services = {
-                "🐧 Sistema": "Linux" if os.name == 'posix' else "Windows",
+                "🐧 Sistema": "Linux" if _IS_POSIX else "Windows",
                 "🐍 Python": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-                "👤 Usuario": "root" if os.geteuid() == 0 else "normal" if os.name == 'posix' else "admin",
+                "👤 Usuario": "root" if _IS_ROOT else "normal" if _IS_POSIX else "admin",
                 "📂 Directorio": os.getcwd()
             }
             
@@ -167,38 +465,8 @@ class CLI:
     
     def _show_interactive_help(self):
         """Mostrar ayuda interactiva"""
-        help_text = """
-[bold cyan]Comandos Principales:[/bold cyan]
-
-[bold]Gestión de Aplicaciones:[/bold]
-  • [green]webapp-manager list[/green]                    - Listar aplicaciones
-  • [green]webapp-manager add[/green] --domain app.com     - Agregar aplicación
-  • [green]webapp-manager remove[/green] --domain app.com  - Eliminar aplicación
-  • [green]webapp-manager update[/green] --domain app.com  - Actualizar aplicación
-  • [green]webapp-manager restart[/green] --domain app.com - Reiniciar aplicación
-
-[bold]Monitoreo y Diagnóstico:[/bold]
-  • [green]webapp-manager status[/green]                   - Estado del sistema
-  • [green]webapp-manager logs[/green] --domain app.com    - Ver logs
-  • [green]webapp-manager diagnose[/green]                 - Diagnóstico completo
-
-[bold]Herramientas:[/bold]
-  • [green]webapp-manager types[/green]                    - Tipos de aplicación
-  • [green]webapp-manager detect[/green] --directory ./app - Detectar tipo
-
-[bold]Opciones:[/bold]
-  • [yellow]--verbose, -v[/yellow]                           - Mostrar logs detallados
-
-[bold]Ejemplos Rápidos:[/bold]
-  • [dim]webapp-manager add --domain mi-app.com --source https://github.com/user/app.git --port 3000[/dim]
-  • [dim]webapp-manager list --detailed[/dim]
-  • [dim]webapp-manager logs --domain mi-app.com --follow[/dim]
-
-Para ayuda detallada: [bold]webapp-manager --help[/bold]
-        """
-        
         self.console.print(Panel(
-            help_text.strip(),
+            _QUICK_HELP_TEXT,
             title="[bold]Guía de Inicio Rápido[/bold]",
             border_style="yellow",
             padding=(1, 2)
@@ -208,53 +476,118 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
         """Context manager para mostrar spinner de carga"""
         return self.console.status(f"[bold green]{message}...", spinner="dots")
     
+    def _confirm(self, prompt: str, **kwargs) -> bool:
+        """Pedir confirmación sí/no al usuario (--yes responde sí sin preguntar)"""
+        if self.assume_yes:
+            return True
+        from rich.prompt import Confirm
+        try:
+            return Confirm.ask(prompt, **kwargs)
+        except EOFError:
+            # Entrada no interactiva agotada: rechazar siempre, aunque el
+            # valor por defecto sea sí (para aceptar sin preguntar: --yes)
+            return False
+    
+    def _ask_enable(self, prompt: str) -> Optional[bool]:
+        """
+        Preguntar si activar (sí) o desactivar (no) un modo. Aquí "no" no
+        cancela, así que con --yes o sin entrada interactiva no se elige
+        por el usuario: se muestra un error y se devuelve None.
+        """
+        if not self.assume_yes:
+            from rich.prompt import Confirm
+            try:
+                return Confirm.ask(prompt, default=True)
+            except EOFError:
+                pass
+        self._show_error("No se puede preguntar si activar o desactivar: usa --enable o --disable")
+        return None
+    
     def _show_success(self, message: str):
         """Mostrar mensaje de éxito"""
-        self.console.print(f"[bold green]✅ {message}[/bold green]")
+        if self.plain_output:
+            self._print_plain(f"✅ {message}")
+        else:
+            self.console.print(f"[bold green]✅ {message}[/bold green]")
     
     def _show_error(self, message: str):
         """Mostrar mensaje de error"""
-        self.console.print(f"[bold red]❌ {message}[/bold red]")
+        if self.plain_output:
+            self._print_plain(f"❌ {message}")
+        else:
+            self.console.print(f"[bold red]❌ {message}[/bold red]")
     
     def _show_warning(self, message: str):
         """Mostrar mensaje de advertencia"""
-        self.console.print(f"[bold yellow]⚠️  {message}[/bold yellow]")
+        if self.plain_output:
+            self._print_plain(f"⚠️  {message}")
+        else:
+            self.console.print(f"[bold yellow]⚠️  {message}[/bold yellow]")
     
-    def _show_info(self, message: str):
-        """Mostrar mensaje informativo"""
+    def _show_info(self, message: Union[str, Callable[[], str]], *args):
+        """
+        Mostrar mensaje informativo (solo en modo verbose). El mensaje puede
+        ser una plantilla con args para str.format o una función que lo
+        construya, de modo que no se formatea si no se va a mostrar.
+        """
         if self.verbose:
-            self.console.print(f"[bold blue]ℹ️  {message}[/bold blue]")
+            if callable(message):
+                message = message()
+            elif args:
+                message = message.format(*args)
+            if self.plain_output:
+                self._print_plain(f"ℹ️  {message}")
+            else:
+                self.console.print(f"[bold blue]ℹ️  {message}[/bold blue]")
+    
+    def _exit_with_error(self, message: str, hint: Optional[Callable[[], str]] = None):
+        """
+        Mostrar un error fatal y salir con código 1. El error y la pista
+        (solo en modo verbose, como _show_info) se escriben de una vez.
+        """
+        lines = [(f"❌ {message}", "bold red")]
+        if hint is not None and self.verbose:
+            lines.append((f"ℹ️  {hint()}", "bold blue"))
+        
+        if self.plain_output:
+            self._print_plain("\n".join(text for text, _ in lines))
+        else:
+            self.console.print(*(f"[{style}]{text}[/{style}]" for text, style in lines), sep="\n")
+        sys.exit(1)
+    
+    def _print_plain(self, message: str):
+        """Escribir un mensaje sin Rich, quitando las etiquetas de estilo"""
+        print(_MARKUP_TAG_RE.sub("", message))
     
     def _create_parser(self) -> argparse.ArgumentParser:
         """Crear parser de argumentos"""
         parser = argparse.ArgumentParser(
             description="🚀 WebApp Manager v4.0 - Sistema modular de gestión de aplicaciones web",
             formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog=self._get_examples()
+            epilog=_EXAMPLES_EPILOG
         )
         
         # Comando principal
         parser.add_argument(
             "command",
-            choices=[
-                "add", "remove", "list", "restart", "update", 
-                "logs", "ssl", "diagnose", "repair", "status",
-                "export", "import", "types", "detect", "fix-config",
-                "apply-maintenance", "maintenance", "updating", "sync-pages",
-                "setup", "check-system", "version", "gui"
-            ],
+            # Dict ordenado: usage lista los comandos en orden y la validación es O(1)
+            choices=COMMANDS,
             help="Comando a ejecutar"
         )
         
         # Argumentos principales
-        parser.add_argument("--domain", "-d", help="Dominio de la aplicación")
+        parser.add_argument(
+            "--domain", "-d",
+            help="Dominio de la aplicación (restart, update, repair y logs aceptan varios separados por comas)"
+        )
         parser.add_argument("--source", "-s", help="Ruta o URL del código fuente")
         parser.add_argument("--port", "-p", type=int, help="Puerto de la aplicación")
         parser.add_argument(
             "--type", "-t",
-            choices=DeployerFactory.get_supported_types(),
-            default="nextjs",
-            help="Tipo de aplicación (default: nextjs)"
+            type=_app_type,
+            default=DEFAULT_APP_TYPE,
+            metavar="TIPO",
+            help=f"Tipo de aplicación, ver 'types' (default: {DEFAULT_APP_TYPE})"
         )
         parser.add_argument("--branch", "-b", default="main", help="Rama del repositorio (default: main)")
         
@@ -262,7 +595,7 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
         parser.add_argument("--no-ssl", action="store_true", help="No configurar SSL")
         parser.add_argument("--build-command", help="Comando personalizado de construcción")
         parser.add_argument("--start-command", help="Comando personalizado de inicio")
-        parser.add_argument("--env", action="append", help="Variables de entorno (KEY=VALUE)")
+        parser.add_argument("--env", action=_AppendInPlace, help="Variables de entorno (KEY=VALUE)")
         
         # Opciones para maintenance/updating
         parser.add_argument("--enable", action="store_true", help="Activar modo mantenimiento/actualización")
@@ -278,6 +611,7 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
         parser.add_argument("--email", help="Email para certificados SSL")
         parser.add_argument("--file", help="Archivo para importar/exportar configuración")
         parser.add_argument("--directory", help="Directorio para detectar tipo de aplicación")
+        parser.add_argument("--yes", "-y", action="store_true", help="Responder sí a todas las confirmaciones")
         
         # Opción verbose
         parser.add_argument(
@@ -288,186 +622,47 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
         
         return parser
     
-    def _get_examples(self) -> str:
-        """Obtener ejemplos de uso con formato moderno"""
-        return """
-[bold cyan]Ejemplos de Uso:[/bold cyan]
-
-[bold]� Configuración Inicial (Primera vez):[/bold]
-  webapp-manager setup
-  
-[bold]�📱 Aplicaciones Next.js:[/bold]
-  webapp-manager add --domain app.ejemplo.com --source /ruta/app --port 3000
-  webapp-manager add --domain mi-app.com --source https://github.com/usuario/mi-app.git --port 3001
-  
-[bold]🐍 APIs FastAPI:[/bold]
-  webapp-manager add --domain api.ejemplo.com --source /ruta/api --port 8000 --type fastapi
-  webapp-manager add --domain mi-api.com --source https://github.com/usuario/mi-api.git --port 8001 --type fastapi
-  
-[bold]🟢 Aplicaciones Node.js:[/bold]
-  webapp-manager add --domain node-app.com --source https://github.com/usuario/node-app.git --port 4000 --type nodejs
-  
-[bold]📄 Sitios Estáticos:[/bold]
-  webapp-manager add --domain sitio.com --source /ruta/sitio --type static
-
-[bold]🔍 Modo Verbose:[/bold]
-  webapp-manager add --domain app.com --source ./app --port 3000 --verbose
-  webapp-manager update --domain app.com -v
-  
-[bold]📊 Gestión y Monitoreo:[/bold]
-  webapp-manager list --detailed
-  webapp-manager status --domain mi-app.com
-  webapp-manager logs --domain mi-app.com --lines 100 --follow
-  webapp-manager diagnose --domain mi-app.com
-  webapp-manager restart --domain api.ejemplo.com
-  
-[bold]🔧 Herramientas Avanzadas:[/bold]
-  webapp-manager types
-  webapp-manager detect --directory /ruta/app
-  webapp-manager export --file backup-config.json
-  webapp-manager ssl --domain app.ejemplo.com --email admin@ejemplo.com
-  webapp-manager apply-maintenance   # Aplicar páginas de mantenimiento a apps existentes
-  webapp-manager check-system        # Verificar prerequisitos del sistema
-
-[bold]🛠️  Modo Mantenimiento y Actualización:[/bold]
-  # Modo interactivo (pregunta si activar/desactivar)
-  webapp-manager maintenance --domain app.com
-  webapp-manager updating --domain app.com
-  
-  # Activar explícitamente
-  webapp-manager maintenance --domain app.com --enable
-  webapp-manager updating --domain app.com --enable
-  
-  # Desactivar explícitamente  
-  webapp-manager maintenance --domain app.com --disable
-  webapp-manager updating --domain app.com --disable
-  
-  # Sincronizar páginas HTML
-  webapp-manager sync-pages
-
-[bold]Tipos de aplicación soportados:[/bold]
-  • [green]nextjs[/green]  - Aplicaciones Next.js (por defecto)
-  • [green]nodejs[/green]  - Aplicaciones Node.js genéricas  
-  • [green]fastapi[/green] - APIs FastAPI con Python
-  • [green]static[/green]  - Sitios web estáticos
-
-[bold]Variables de entorno:[/bold]
-  --env NODE_ENV=production --env API_KEY=abc123 --env DATABASE_URL=postgresql://...
-        """
-    
     def _parse_env_vars(self, env_list: List[str]) -> Dict[str, str]:
         """Parsear variables de entorno"""
-        env_vars = {}
-        for env_var in env_list:
-            is_valid, key, value = Validators.validate_env_var(env_var)
-            if is_valid:
-                env_vars[key] = value
-            else:
-                self._show_warning(f"Variable de entorno inválida ignorada: {env_var}")
-        return env_vars
+        matches = [_ENV_VAR_RE.fullmatch(env_var) for env_var in env_list]
+        invalid = [env_var for env_var, match in zip(env_list, matches) if match is None]
+        if invalid:
+            self._show_warning(f"Variables de entorno inválidas ignoradas: {', '.join(invalid)}")
+        return dict(match.groups() for match in matches if match is not None)
     
-    def _execute_command(self, args, env_vars: Dict[str, str]) -> bool:
+    def _execute_command(self, args) -> bool:
         """Ejecutar comando específico"""
         command = args.command
+        handler_name, title = COMMANDS.get(command, (None, command.title()))
         
         # Mostrar header del comando solo en modo verbose
         if self.verbose:
-            command_names = {
-                "add": "Agregar Aplicación",
-                "remove": "Eliminar Aplicación",
-                "list": "Listar Aplicaciones",
-                "restart": "Reiniciar Aplicación",
-                "update": "Actualizar Aplicación",
-                "logs": "Ver Logs",
-                "ssl": "Configurar SSL",
-                "diagnose": "Diagnóstico",
-                "repair": "Reparar Aplicación",
-                "status": "Estado",
-                "export": "Exportar Configuración",
-                "import": "Importar Configuración",
-                "types": "Tipos de Aplicación",
-                "detect": "Detectar Tipo",
-                "fix-config": "Reparar Configuración",
-                "maintenance": "Modo Mantenimiento",
-                "updating": "Modo Actualización",
-                "sync-pages": "Sincronizar Páginas",
-                "setup": "Configuración Inicial",
-                "check-system": "Verificar Prerequisitos del Sistema",
-                "version": "Información de Versión",
-                "gui": "Interfaz Gráfica"
-            }
-            
             self.console.print(Panel(
-                f"[bold cyan]{command_names.get(command, command.title())}[/bold cyan]",
+                f"[bold cyan]{title}[/bold cyan]",
                 style="blue"
             ))
         
-        if command == "add":
-            return self._cmd_add(args, env_vars)
-        elif command == "remove":
-            return self._cmd_remove(args)
-        elif command == "list":
-            return self._cmd_list(args)
-        elif command == "restart":
-            return self._cmd_restart(args)
-        elif command == "update":
-            return self._cmd_update(args)
-        elif command == "logs":
-            return self._cmd_logs(args)
-        elif command == "ssl":
-            return self._cmd_ssl(args)
-        elif command == "diagnose":
-            return self._cmd_diagnose(args)
-        elif command == "repair":
-            return self._cmd_repair(args)
-        elif command == "status":
-            return self._cmd_status(args)
-        elif command == "export":
-            return self._cmd_export(args)
-        elif command == "import":
-            return self._cmd_import(args)
-        elif command == "types":
-            self._cmd_types(args)
-            return True
-        elif command == "detect":
-            self._cmd_detect(args)
-            return True
-        elif command == "fix-config":
-            return self._cmd_fix_config(args)
-        elif command == "apply-maintenance":
-            return self._cmd_apply_maintenance(args)
-        elif command == "maintenance":
-            return self._cmd_maintenance(args)
-        elif command == "updating":
-            return self._cmd_updating(args)
-        elif command == "sync-pages":
-            return self._cmd_sync_pages(args)
-        elif command == "setup":
-            return self._cmd_setup(args)
-        elif command == "check-system":
-            return self._cmd_check_system(args)
-        elif command == "version":
-            self._cmd_version()
-            return True
-        elif command == "gui":
-            self._cmd_gui()
-            return True
-        else:
+        if handler_name is None:
             self._show_error(f"Comando no implementado: {command}")
             return False
+        
+        return getattr(self, handler_name)(args)
     
-    def _cmd_add(self, args, env_vars: Dict[str, str]) -> bool:
+    def _cmd_add(self, args) -> bool:
         """Comando add con progress real"""
         if not args.domain or not args.source or not args.port:
             self._show_error("Para agregar una app necesitas: --domain, --source y --port")
             return False
         
+        # Procesar variables de entorno
+        env_vars = self._parse_env_vars(args.env or [])
+        
         # Mostrar resumen antes de empezar
         if self.verbose:
             self._show_deployment_summary(args, env_vars)
         
         # Confirmar despliegue
-        if not Confirm.ask("¿Proceder con el despliegue?", default=True):
+        if not self._confirm("¿Proceder con el despliegue?", default=True):
             self._show_warning("Despliegue cancelado")
             return False
         
@@ -510,7 +705,7 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
         summary_table.add_row("🔒 SSL", "❌ No" if args.no_ssl else "✅ Sí")
         
         if env_vars:
-            env_display = ", ".join([f"{k}={v}" for k, v in list(env_vars.items())[:3]])
+            env_display = ", ".join(f"{k}={v}" for k, v in islice(env_vars.items(), 3))
             if len(env_vars) > 3:
                 env_display += f" (+{len(env_vars)-3} más)"
             summary_table.add_row("🔧 Variables", env_display)
@@ -565,22 +760,20 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
     
     def _cmd_remove(self, args) -> bool:
         """Comando remove con confirmación"""
-        if not args.domain:
-            self._show_error("Necesitas especificar --domain")
-            return False
-        
         # Confirmación de seguridad
         self._show_warning(f"⚠️  Vas a eliminar la aplicación: [bold red]{args.domain}[/bold red]")
-        self.console.print("[dim]Esta acción eliminará:[/dim]")
-        self.console.print("  • Código fuente de la aplicación")
-        self.console.print("  • Configuración de nginx")
-        self.console.print("  • Servicio systemd")
-        self.console.print("  • Certificados SSL (si existen)")
+        self.console.print(
+            "[dim]Esta acción eliminará:[/dim]\n"
+            "  • Código fuente de la aplicación\n"
+            "  • Configuración de nginx\n"
+            "  • Servicio systemd\n"
+            "  • Certificados SSL (si existen)"
+        )
         
         if not args.no_backup:
             self.console.print("\n[green]✅ Se creará un backup antes de eliminar[/green]")
         
-        if not Confirm.ask(f"\n¿Confirmas la eliminación de {args.domain}?", default=False):
+        if not self._confirm(f"\n¿Confirmas la eliminación de {args.domain}?", default=False):
             self._show_info("Eliminación cancelada")
             return True
         
@@ -597,16 +790,10 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
     def _cmd_list(self, args) -> bool:
         """Comando list con tabla moderna"""
         try:
-            apps = self.manager.list_apps()
+            apps = list(self.manager.config_manager.get_all_apps().values())
             
             if not apps:
-                self.console.print(Panel(
-                    "[yellow]No hay aplicaciones desplegadas[/yellow]\n\n"
-                    "Para desplegar tu primera aplicación:\n"
-                    "[cyan]webapp-manager add --domain ejemplo.com --source /ruta --port 3000[/cyan]",
-                    title="Sin Aplicaciones",
-                    border_style="yellow"
-                ))
+                self.console.print(_NO_APPS_PANEL)
                 return True
             
             # Crear tabla de aplicaciones
@@ -622,20 +809,16 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
                 table.add_column("📅 Actualizado", style="dim", width=12)
                 table.add_column("📂 Fuente", style="dim", width=30)
             
+            # Estado de todos los servicios con una sola consulta a systemd
+            states = self.manager.systemd_service.get_active_states([app.domain for app in apps])
+            
+            active_count = 0
             for app in apps:
                 try:
-                    # Obtener estado actualizado
-                    status = self.manager.systemd_service.get_service_status(app.domain)
-                    
-                    # Determinar icono y color del estado
-                    if "Activo" in status:
-                        status_display = "[green]🟢 Activo[/green]"
-                    elif "Inactivo" in status:
-                        status_display = "[yellow]🟡 Inactivo[/yellow]"
-                    elif "Fallido" in status:
-                        status_display = "[red]🔴 Fallido[/red]"
-                    else:
-                        status_display = "[dim]🔘 Desconocido[/dim]"
+                    status = states[app.domain]
+                    status_display = _LIST_STATUS_DISPLAY.get(status, _LIST_STATUS_UNKNOWN)
+                    if status == "active":
+                        active_count += 1
                     
                     ssl_display = "✅" if app.ssl else "❌"
                     
@@ -672,8 +855,6 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
             self.console.print(table)
             
             # Mostrar estadísticas
-            active_count = sum(1 for app in apps 
-                             if "Activo" in self.manager.systemd_service.get_service_status(app.domain))
             ssl_count = sum(1 for app in apps if app.ssl)
             
             stats_panel = Panel(
@@ -694,51 +875,56 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
             self._show_error(f"Error listando aplicaciones: {e}")
             return False
     
-    def _cmd_restart(self, args) -> bool:
-        """Comando restart"""
-        if not args.domain:
+    def _for_each_domain(self, domains: str, action: Callable[[str], bool]) -> bool:
+        """Ejecutar action para cada dominio de --domain (a,b,c) sin detenerse en un fallo"""
+        domain_list = _split_domains(domains)
+        if not domain_list:
             self._show_error("Necesitas especificar --domain")
             return False
-        
-        result = self.manager.restart_app(args.domain)
+        results = [action(domain) for domain in domain_list]
+        return all(results)
+    
+    def _cmd_restart(self, args) -> bool:
+        """Comando restart"""
+        return self._for_each_domain(args.domain, self._restart_app)
+    
+    def _restart_app(self, domain: str) -> bool:
+        """Reiniciar una aplicación"""
+        result = self.manager.restart_app(domain)
         
         if result:
-            self._show_success(f"Aplicación {args.domain} reiniciada exitosamente")
+            self._show_success(f"Aplicación {domain} reiniciada exitosamente")
         else:
-            self._show_error(f"Error reiniciando {args.domain}")
+            self._show_error(f"Error reiniciando {domain}")
         
         return result
     
     def _cmd_update(self, args) -> bool:
         """Comando update con logging mejorado"""
-        if not args.domain:
-            self._show_error("Necesitas especificar --domain")
-            return False
-        
+        return self._for_each_domain(args.domain, self._update_app)
+    
+    def _update_app(self, domain: str) -> bool:
+        """Actualizar una aplicación"""
         # Mostrar encabezado
-        self.console.print()
-        self.console.print(Panel(
-            f"[bold white]Actualizando: {args.domain}[/bold white]\n"
+        self.console.print("", Panel(
+            f"[bold white]Actualizando: {domain}[/bold white]\n"
             f"[dim]Se actualizará el código y reconstruirá la aplicación[/dim]",
             title="🔄 Actualización de Aplicación",
             border_style="cyan",
             padding=(1, 2)
-        ))
-        self.console.print()
+        ), "")
         
-        result = self.manager.update_app(args.domain)
+        result = self.manager.update_app(domain)
         
         if result:
-            self.console.print()
-            self.console.print(Panel(
-                f"[bold green]✅ Aplicación {args.domain} actualizada exitosamente[/bold green]",
+            self.console.print("", Panel(
+                f"[bold green]✅ Aplicación {domain} actualizada exitosamente[/bold green]",
                 border_style="green",
                 padding=(0, 2)
             ))
         else:
-            self.console.print()
-            self.console.print(Panel(
-                f"[bold red]❌ Error actualizando {args.domain}[/bold red]",
+            self.console.print("", Panel(
+                f"[bold red]❌ Error actualizando {domain}[/bold red]",
                 border_style="red",
                 padding=(0, 2)
             ))
@@ -747,35 +933,44 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
     
     def _cmd_logs(self, args) -> bool:
         """Mostrar logs con formato mejorado"""
-        if not args.domain:
-            self._show_error("Necesitas especificar --domain")
-            return False
-        
         try:
             if args.follow:
-                # Logs en tiempo real
+                # Logs en tiempo real (bloquea: un único dominio)
+                domains = _split_domains(args.domain)
+                if not domains:
+                    self._show_error("Necesitas especificar --domain")
+                    return False
+                if len(domains) > 1:
+                    self._show_error("--follow solo admite un dominio")
+                    return False
+                domain = domains[0]
+                
                 self.console.print(Panel(
-                    f"[bold]Siguiendo logs de {args.domain} en tiempo real[/bold]\n"
+                    f"[bold]Siguiendo logs de {domain} en tiempo real[/bold]\n"
                     f"[dim]Presiona Ctrl+C para salir[/dim]",
                     title="📡 Logs en Tiempo Real",
                     border_style="blue"
                 ))
                 
-                return self.manager.logs(args.domain, args.lines, args.follow)
+                return self.manager.logs(domain, args.lines, args.follow)
             else:
-                # Logs estáticos
-                self.console.print(Panel(
-                    f"[bold]Logs de {args.domain} (últimas {args.lines} líneas)[/bold]",
-                    title="📋 Logs de Aplicación",
-                    border_style="green"
-                ))
-                
-                return self.manager.logs(args.domain, args.lines, args.follow)
+                # Logs estáticos, uno detrás de otro si hay varios dominios
+                return self._for_each_domain(args.domain, lambda domain: self._show_logs(domain, args.lines))
                 
         except Exception as e:
             self._show_error(f"Error obteniendo logs: {e}")
             return False
     
+    def _show_logs(self, domain: str, lines: int) -> bool:
+        """Mostrar las últimas líneas de log de una aplicación"""
+        self.console.print(Panel(
+            f"[bold]Logs de {domain} (últimas {lines} líneas)[/bold]",
+            title="📋 Logs de Aplicación",
+            border_style="green"
+        ))
+        
+        return self.manager.logs(domain, lines, False)
+    
     def _cmd_status(self, args) -> bool:
         """Mostrar estado con información detallada"""
         try:
@@ -789,10 +984,18 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
     
     def _show_app_status(self, domain: str) -> bool:
         """Mostrar estado de aplicación específica"""
+        from concurrent.futures import ThreadPoolExecutor
+        
         try:
             app_config = self.manager.config_manager.get_app(domain)
-            status = self.manager.systemd_service.get_service_status(domain)
-            connectivity = self.manager.app_service.test_connectivity(domain, app_config.port)
+            
+            # La prueba de conectividad corre mientras se consulta systemd
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                connectivity_future = executor.submit(
+                    self.manager.app_service.test_connectivity, domain, app_config.port, wait=0
+                )
+                status = self.manager.systemd_service.get_active_state(domain)
+                connectivity = connectivity_future.result()
             
             # Crear tabla de estado
             status_table = Table(title=f"📊 Estado de {domain}")
@@ -800,51 +1003,42 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
             status_table.add_column("Estado", style="white", width=30)
             status_table.add_column("Detalles", style="dim", width=40)
             
-            # Estado del servicio
-            if "Activo" in status:
-                service_status = "[green]🟢 Funcionando[/green]"
-                service_details = "Servicio systemd activo"
-            elif "Inactivo" in status:
-                service_status = "[yellow]🟡 Detenido[/yellow]"
-                service_details = "Servicio systemd inactivo"
-            else:
-                service_status = "[red]🔴 Error[/red]"
-                service_details = "Problema con el servicio"
-            
-            status_table.add_row("⚡ Servicio", service_status, service_details)
-            
-            # Conectividad
+            # Filas de la tabla: servicio, conectividad, SSL e información adicional
+            service_status, service_details = _APP_STATUS_DISPLAY.get(status, _APP_STATUS_ERROR)
             if connectivity:
-                conn_status = "[green]🌐 Responde[/green]"
-                conn_details = f"HTTP OK en puerto {app_config.port}"
+                conn_row = ("🌐 Conectividad", "[green]🌐 Responde[/green]", f"HTTP OK en puerto {app_config.port}")
             else:
-                conn_status = "[red]🔴 No responde[/red]"
-                conn_details = f"Sin respuesta en puerto {app_config.port}"
-            
-            status_table.add_row("🌐 Conectividad", conn_status, conn_details)
-            
-            # SSL
-            ssl_status = "[green]🔒 Configurado[/green]" if app_config.ssl else "[yellow]🔓 Sin SSL[/yellow]"
-            ssl_details = "HTTPS habilitado" if app_config.ssl else "Solo HTTP"
-            status_table.add_row("🔒 SSL", ssl_status, ssl_details)
+                conn_row = ("🌐 Conectividad", "[red]🔴 No responde[/red]", f"Sin respuesta en puerto {app_config.port}")
+            
+            rows = (
+                ("⚡ Servicio", service_status, service_details),
+                conn_row,
+                _SSL_ROW_ON if app_config.ssl else _SSL_ROW_OFF,
+                ("📱 Tipo", app_config.app_type, f"Deployer {app_config.app_type}"),
+                ("🚪 Puerto", str(app_config.port), "Puerto interno"),
+                ("📅 Actualizado", app_config.last_updated[:19] if app_config.last_updated else "N/A", "Última modificación"),
+            )
+            for row in rows:
+                status_table.add_row(*row)
             
-            # Información adicional
-            status_table.add_row("📱 Tipo", app_config.app_type, f"Deployer {app_config.app_type}")
-            status_table.add_row("🚪 Puerto", str(app_config.port), "Puerto interno")
-            status_table.add_row("📅 Actualizado", app_config.last_updated[:19] if app_config.last_updated else "N/A", "Última modificación")
+            # URLs de acceso: se derivan del dominio y el puerto ya mostrados,
+            # así que fuera de una terminal (scripts, monitoreo) se omiten
+            if self.plain_output:
+                self.console.print(status_table)
+                return True
             
-            self.console.print(status_table)
+            # Texto con estilos ya asignados: no pasa por el parser de markup
+            url_parts = [("🔗 URLs de acceso:", "bold"), "\n• HTTP: ", (f"http://{domain}", "link"), "\n"]
+            if app_config.ssl:
+                url_parts += ["• HTTPS: ", (f"https://{domain}", "link"), "\n"]
+            url_parts += ["• Puerto directo: ", (f"http://servidor:{app_config.port}", "dim")]
             
-            # URLs de acceso
             urls_panel = Panel(
-                f"[bold]🔗 URLs de acceso:[/bold]\n"
-                f"• HTTP: [link]http://{domain}[/link]\n" +
-                (f"• HTTPS: [link]https://{domain}[/link]\n" if app_config.ssl else "") +
-                f"• Puerto directo: [dim]http://servidor:{app_config.port}[/dim]",
+                Text.assemble(*url_parts),
                 title="Acceso",
                 border_style="blue"
             )
-            self.console.print(urls_panel)
+            self.console.print(status_table, urls_panel)
             
             return True
             
@@ -856,12 +1050,16 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
         """Mostrar estado general del sistema"""
         try:
             # Obtener información del sistema
-            apps = self.manager.list_apps()
-            active_count = sum(1 for app in apps 
-                             if "Activo" in self.manager.systemd_service.get_service_status(app.domain))
+            apps = list(self.manager.config_manager.get_all_apps().values())
+            
+            # nginx se consulta en la misma llamada a systemctl que las
+            # aplicaciones; por posición, ya que una app puede llamarse "nginx"
+            *app_states, nginx_status = self.manager.systemd_service.get_active_state_list(
+                [app.domain for app in apps] + ["nginx"]
+            )
+            active_count = app_states.count("active")
             
-            # Estado de nginx
-            nginx_status = self.manager.cmd.run_sudo("systemctl is-active nginx", check=False)
+            # Configuración de nginx
             nginx_config_ok = self.manager.nginx_service.test_config()
             
             # Crear tabla de estado del sistema
@@ -892,27 +1090,27 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
             
             # WebApp Manager
             system_table.add_row("🚀 WebApp Manager", "[green]🟢 Funcionando[/green]", "Sistema operativo")
-            
-            self.console.print(system_table)
+            renderables = [system_table]
             
             # Panel de recursos
             try:
-                disk_usage = self.manager.cmd.run("df -h / | awk 'NR==2{print $5}'", check=False)
-                memory_info = self.manager.cmd.run("free -h | awk 'NR==2{print $3\"/\"$2}'", check=False)
+                disk_usage = _disk_usage_percent("/")
+                memory_info = _memory_usage()
                 
                 resources_panel = Panel(
                     f"[bold]💻 Recursos del Sistema:[/bold]\n"
                     f"• Disco usado: {disk_usage or 'N/A'}\n"
                     f"• Memoria: {memory_info or 'N/A'}\n"
-                    f"• Sistema: {os.name} ({os.uname().machine if hasattr(os, 'uname') else 'N/A'})",
+                    f"• Sistema: {os.name} ({_MACHINE})",
                     title="Recursos",
                     border_style="yellow"
                 )
-                self.console.print(resources_panel)
+                renderables.append(resources_panel)
                 
             except:
                 pass  # Ignorar errores de recursos
             
+            self.console.print(*renderables)
             return True
             
         except Exception as e:
@@ -921,10 +1119,6 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
     
     def _cmd_ssl(self, args) -> bool:
         """Comando SSL"""
-        if not args.domain:
-            self._show_error("Necesitas especificar --domain")
-            return False
-        
         result = self.manager.setup_ssl(args.domain, args.email)
         
         if result:
@@ -942,16 +1136,16 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
     
     def _cmd_repair(self, args) -> bool:
         """Comando repair"""
-        if not args.domain:
-            self._show_error("Necesitas especificar --domain")
-            return False
-        
-        result = self.manager.repair_app(args.domain)
+        return self._for_each_domain(args.domain, self._repair_app)
+    
+    def _repair_app(self, domain: str) -> bool:
+        """Reparar una aplicación"""
+        result = self.manager.repair_app(domain)
         
         if result:
-            self._show_success(f"Aplicación {args.domain} reparada exitosamente")
+            self._show_success(f"Aplicación {domain} reparada exitosamente")
         else:
-            self._show_error(f"Error reparando {args.domain}")
+            self._show_error(f"Error reparando {domain}")
         
         return result
     
@@ -985,8 +1179,10 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
         
         return result
     
-    def _cmd_types(self, args):
+    def _cmd_types(self, args) -> bool:
         """Mostrar tipos de deployers disponibles"""
+        from ..deployers import DeployerFactory
+        
         deployers = DeployerFactory.list_all_deployers()
         
         # Crear tabla de tipos
@@ -1009,34 +1205,23 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
                 status
             )
         
-        self.console.print(types_table)
-        
-        # Ejemplos de uso
-        examples_panel = Panel(
-            """[bold]Ejemplos de uso por tipo:[/bold]
-
-[cyan]nextjs[/cyan]:  webapp-manager add --domain app.com --source ./my-nextjs-app --port 3000 --type nextjs
-[cyan]fastapi[/cyan]: webapp-manager add --domain api.com --source ./my-fastapi-api --port 8000 --type fastapi  
-[cyan]nodejs[/cyan]:  webapp-manager add --domain node.com --source ./my-node-app --port 5000 --type nodejs
-[cyan]static[/cyan]:  webapp-manager add --domain site.com --source ./my-static-site --type static
-            """,
-            title="Ejemplos",
-            border_style="blue"
-        )
-        self.console.print(examples_panel)
+        # Tabla y ejemplos de uso
+        self.console.print(types_table, _TYPE_EXAMPLES_PANEL)
+        return True
     
-    def _cmd_detect(self, args):
+    def _cmd_detect(self, args) -> bool:
         """Detectar tipo de aplicación"""
+        from ..deployers import DeployerFactory
+        
         directory = args.directory or "."
         
         with self._loading(f"Analizando directorio {directory}"):
             try:
-                detected_type = DeployerFactory.detect_app_type(directory)
-                is_valid = DeployerFactory.validate_app_type(directory, detected_type)
+                detected_type, is_valid = DeployerFactory.detect_and_validate(directory)
                 
             except Exception as e:
                 self._show_error(f"Error detectando tipo: {e}")
-                return
+                return False
         
         # Mostrar resultado
         validation_status = "✅ Válida" if is_valid else "⚠️  Requiere ajustes"
@@ -1052,7 +1237,6 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
             title="🔍 Resultado de Detección",
             border_style="cyan"
         )
-        self.console.print(result_panel)
         
         # Mostrar información del deployer
         try:
@@ -1066,10 +1250,13 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
             if info['optional_files']:
                 info_table.add_row("📄 Archivos opcionales", ", ".join(info['optional_files']))
             
-            self.console.print(info_table)
+            self.console.print(result_panel, info_table)
             
         except Exception as e:
+            self.console.print(result_panel)
             self._show_warning(f"No se pudo obtener información detallada: {e}")
+        
+        return True
     
     def _cmd_fix_config(self, args) -> bool:
         """Comando fix-config"""
@@ -1078,72 +1265,55 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
     
     def _cmd_apply_maintenance(self, args) -> bool:
         """Aplicar configuración de páginas de mantenimiento a aplicaciones existentes"""
+        from concurrent.futures import ThreadPoolExecutor
+        
         try:
             # Mostrar información sobre el comando
-            info_panel = Panel(
-                "[bold cyan]Aplicar Páginas de Mantenimiento[/bold cyan]\n\n"
-                "Este comando actualiza las configuraciones de nginx existentes para incluir:\n"
-                "• Redirección automática a páginas de mantenimiento en errores 502/503/504\n"
-                "• Páginas profesionales y modernas de actualización y error\n"
-                "• Configuración automática para todas las aplicaciones\n\n"
-                "[dim]Las páginas se sirven desde /apps/maintenance/ y se actualizan cada 30 segundos[/dim]",
-                title="ℹ️  Información",
-                style="blue"
-            )
-            self.console.print(info_panel)
+            self.console.print(_APPLY_MAINTENANCE_INFO_PANEL)
             
             # Confirmar la operación
-            if not Confirm.ask("[yellow]¿Desea aplicar las configuraciones de mantenimiento a todas las aplicaciones?[/yellow]"):
+            if not self._confirm("[yellow]¿Desea aplicar las configuraciones de mantenimiento a todas las aplicaciones?[/yellow]"):
                 self._show_info("Operación cancelada")
                 return True
             
-            # Inicializar el manager si es necesario
-            if not self.manager:
-                self.manager = WebAppManager(verbose=self.verbose, progress_manager=self.progress_manager)
-            
-            # Obtener lista de aplicaciones
-            apps = self.manager.config_manager.list_apps()
+            # Cargar la configuración de todas las aplicaciones de una vez
+            apps = self.manager.config_manager.get_all_apps()
             
             if not apps:
                 self._show_warning("No se encontraron aplicaciones instaladas")
                 return True
             
-            self._show_info(f"Aplicando configuración de mantenimiento a {len(apps)} aplicaciones...")
+            self._show_info("Aplicando configuración de mantenimiento a {} aplicaciones...", len(apps))
             
             # Crear directorio de mantenimiento y copiar archivos
             with self._loading("Configurando directorio de mantenimiento"):
                 self.manager.nginx_service.ensure_maintenance_directory()
             
-            success_count = 0
-            error_count = 0
+            # Escribir las configuraciones en paralelo: cada hilo solo escribe
+            # los archivos de su dominio, sin validar ni imprimir; `nginx -t`
+            # revisa todos los sitios, así que se ejecuta una vez al terminar
+            with self._loading("Actualizando configuraciones de nginx"):
+                with ThreadPoolExecutor(max_workers=min(16, len(apps))) as executor:
+                    outcomes = list(executor.map(self._apply_maintenance_config, apps.values()))
             
-            # Procesar cada aplicación
-            for domain in apps:
-                try:
-                    app_config = self.manager.config_manager.get_app(domain)
-                    
-                    with self._loading(f"Actualizando {domain}"):
-                        if self.manager.nginx_service.has_maintenance_config(domain):
-                            self.console.print(f"  ✅ [green]{domain}[/green] - Ya tiene configuración de mantenimiento")
-                        else:
-                            if self.manager.nginx_service.update_config_with_maintenance(app_config):
-                                self.console.print(f"  ✅ [green]{domain}[/green] - Configuración aplicada exitosamente")
-                                success_count += 1
-                            else:
-                                self.console.print(f"  ❌ [red]{domain}[/red] - Error aplicando configuración")
-                                error_count += 1
-                
-                except Exception as e:
-                    self.console.print(f"  ❌ [red]{domain}[/red] - Error: {str(e)}")
-                    error_count += 1
+            success_count = sum(1 for applied, _ in outcomes if applied is True)
+            error_count = sum(1 for applied, _ in outcomes if applied is False)
+            self.console.print("\n".join(line for _, line in outcomes))
             
-            # Recargar nginx si hubo cambios
+            # Validar una sola vez y recargar nginx si hubo cambios
+            config_valid = True
             if success_count > 0:
-                with self._loading("Recargando nginx"):
-                    if self.manager.nginx_service.reload():
-                        self._show_success("Nginx recargado exitosamente")
-                    else:
-                        self._show_warning("Problemas al recargar nginx")
+                with self._loading("Validando configuración de nginx"):
+                    config_valid = self.manager.nginx_service.test_config()
+                
+                if not config_valid:
+                    self._show_error("La configuración de nginx no es válida (revisa 'nginx -t'); no se recarga nginx")
+                else:
+                    with self._loading("Recargando nginx"):
+                        if self.manager.nginx_service.reload():
+                            self._show_success("Nginx recargado exitosamente")
+                        else:
+                            self._show_warning("Problemas al recargar nginx")
             
             # Mostrar resumen
             summary_table = Table(title="📊 Resumen de la operación")
@@ -1157,19 +1327,9 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
             self.console.print(summary_table)
             
             if success_count > 0:
-                success_panel = Panel(
-                    "[bold green]✅ Configuración aplicada exitosamente[/bold green]\n\n"
-                    "Las aplicaciones ahora mostrarán automáticamente páginas de mantenimiento cuando:\n"
-                    "• El servicio esté caído (error 502/503/504)\n"
-                    "• Se esté realizando una actualización\n"
-                    "• Ocurra un error interno del servidor (error 500)\n\n"
-                    "[dim]Las páginas se actualizan automáticamente cada 30 segundos[/dim]",
-                    title="🎉 Completado",
-                    style="green"
-                )
-                self.console.print(success_panel)
+                self.console.print(_APPLY_MAINTENANCE_DONE_PANEL)
             
-            return error_count == 0
+            return error_count == 0 and config_valid
             
         except Exception as e:
             self._show_error(f"Error aplicando configuración de mantenimiento: {str(e)}")
@@ -1181,22 +1341,10 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
             from ..services import InstallService
             
             # Mostrar información sobre el setup
-            setup_panel = Panel(
-                "[bold cyan]Configuración Inicial del Sistema[/bold cyan]\n\n"
-                "Este comando realizará las siguientes tareas:\n\n"
-                "• ✅ Verificar requisitos del sistema (nginx, python3, systemctl)\n"
-                "• 📄 Instalar páginas de mantenimiento en /apps/maintenance/\n"
-                "• 🔍 Verificar conflictos con el sitio default de nginx\n"
-                "• 🔧 Configurar directorios necesarios\n\n"
-                "[dim]Este comando debe ejecutarse una vez después de instalar webapp-manager[/dim]\n"
-                "[yellow]⚠️  Se requieren permisos de root (sudo)[/yellow]",
-                title="ℹ️  Información de Setup",
-                style="blue"
-            )
-            self.console.print(setup_panel)
+            self.console.print(_SETUP_INFO_PANEL)
             
             # Confirmar la operación
-            if not Confirm.ask("[yellow]¿Desea continuar con la configuración inicial?[/yellow]", default=True):
+            if not self._confirm("[yellow]¿Desea continuar con la configuración inicial?[/yellow]", default=True):
                 self._show_info("Configuración cancelada")
                 return True
             
@@ -1208,20 +1356,7 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
                 success = install_service.run_initial_setup()
             
             if success:
-                success_panel = Panel(
-                    "[bold green]✅ Configuración inicial completada exitosamente[/bold green]\n\n"
-                    "El sistema está listo para usar. Puedes:\n\n"
-                    "• Agregar tu primera aplicación:\n"
-                    "  [cyan]webapp-manager add --domain app.com --source /path --port 3000[/cyan]\n\n"
-                    "• Ver aplicaciones instaladas:\n"
-                    "  [cyan]webapp-manager list[/cyan]\n\n"
-                    "• Ver tipos de aplicaciones soportados:\n"
-                    "  [cyan]webapp-manager types[/cyan]\n\n"
-                    "[dim]Las páginas de mantenimiento se han instalado en /apps/maintenance/[/dim]",
-                    title="🎉 Setup Completado",
-                    style="green"
-                )
-                self.console.print(success_panel)
+                self.console.print(_SETUP_DONE_PANEL)
                 return True
             else:
                 self._show_error("La configuración inicial falló. Revisa los mensajes anteriores para más detalles.")
@@ -1234,12 +1369,7 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
     def _cmd_check_system(self, args) -> bool:
         """Verificar prerequisitos del sistema"""
         try:
-            self.console.print(Panel(
-                "[bold cyan]Verificación de Prerequisitos del Sistema[/bold cyan]\n\n"
-                "Verificando la instalación de herramientas requeridas...",
-                title="🔍 Check System",
-                style="blue"
-            ))
+            self.console.print(_CHECK_SYSTEM_PANEL)
             
             # Ejecutar verificación
             self.manager.check_prerequisites()
@@ -1251,36 +1381,51 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
             self._show_error(f"Error verificando prerequisitos: {str(e)}")
             return False
     
-    def _cmd_version(self):
+    def _cmd_version(self, args=None) -> bool:
         """Mostrar información de versión"""
+        from rich.align import Align
         from .. import __version__, __description__
         
         version_info = Table(show_header=False, box=None)
         version_info.add_row("🚀", f"[bold cyan]WebApp Manager[/bold cyan]")
         version_info.add_row("📦", f"Versión: [bold green]{__version__}[/bold green]")
         version_info.add_row("📝", f"Descripción: {__description__}")
-        version_info.add_row("🐍", f"Python: {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
-        version_info.add_row("🐧", f"Sistema: {'Linux' if os.name == 'posix' else 'Windows'}")
+        version_info.add_row("🐍", f"Python: {_PYTHON_VERSION}")
+        version_info.add_row("🐧", f"Sistema: {'Linux' if _IS_POSIX else 'Windows'}")
         
         self.console.print(Panel(
             Align.center(version_info),
             title="[bold]Información del Sistema[/bold]",
             style="blue"
         ))
+        return True
     
-    def _cmd_gui(self):
+    def _cmd_gui(self, args) -> bool:
         """Abrir interfaz gráfica (dialog)"""
         self._show_info("Abriendo interfaz gráfica con Dialog...")
         # Aquí iría la implementación de la GUI con dialog
         self._show_warning("Función GUI no implementada todavía")
+        return True
+    
+    def _apply_maintenance_config(self, app_config) -> Tuple[Optional[bool], str]:
+        """
+        Escribir la configuración de mantenimiento de una aplicación (sin
+        validar nginx ni recargar: lo hace el llamador una vez para todas)
+        Returns: (True si se aplicó, None si ya la tenía, False si falló; línea de resultado)
+        """
+        domain = app_config.domain
+        try:
+            if self.manager.nginx_service.has_maintenance_config(domain):
+                return None, f"  ✅ [green]{domain}[/green] - Ya tiene configuración de mantenimiento"
+            self.manager.nginx_service.write_config(app_config)
+            return True, f"  ✅ [green]{domain}[/green] - Configuración aplicada exitosamente"
+        
+        except Exception as e:
+            return False, f"  ❌ [red]{domain}[/red] - Error: {str(e)}"
     
     def _cmd_maintenance(self, args) -> bool:
         """Activar o desactivar modo mantenimiento para una aplicación"""
         try:
-            if not args.domain:
-                self._show_error("Debe especificar un dominio con --domain")
-                return False
-            
             # Determinar si activar o desactivar
             if args.enable and args.disable:
                 self._show_error("No puedes usar --enable y --disable al mismo tiempo")
@@ -1306,10 +1451,9 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
                 self.console.print(info_panel)
                 
                 # Preguntar si activar o desactivar
-                enable = Confirm.ask(
-                    "[yellow]¿Activar modo mantenimiento?[/yellow] (No = desactivar)",
-                    default=True
-                )
+                enable = self._ask_enable("[yellow]¿Activar modo mantenimiento?[/yellow] (No = desactivar)")
+                if enable is None:
+                    return False
             
             # Ejecutar comando
             action_text = "Activando" if enable else "Desactivando"
@@ -1319,12 +1463,16 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
             if success:
                 if enable:
                     self._show_success(f"✅ Modo mantenimiento activado para {args.domain}")
-                    self.console.print(f"[dim]Los usuarios verán la página de mantenimiento en https://{args.domain}[/dim]")
-                    self.console.print(f"[bold yellow]Para desactivar:[/bold yellow] webapp-manager maintenance --domain {args.domain} --disable")
+                    self.console.print(
+                        f"[dim]Los usuarios verán la página de mantenimiento en https://{args.domain}[/dim]\n"
+                        f"[bold yellow]Para desactivar:[/bold yellow] webapp-manager maintenance --domain {args.domain} --disable"
+                    )
                 else:
                     self._show_success(f"✅ Modo mantenimiento desactivado para {args.domain}")
-                    self.console.print(f"[dim]La aplicación está nuevamente accesible en https://{args.domain}[/dim]")
-                    self.console.print(f"[bold green]✓[/bold green] Configuración anterior restaurada desde backup")
+                    self.console.print(
+                        f"[dim]La aplicación está nuevamente accesible en https://{args.domain}[/dim]\n"
+                        "[bold green]✓[/bold green] Configuración anterior restaurada desde backup"
+                    )
             else:
                 self._show_error(f"❌ Error configurando modo mantenimiento para {args.domain}")
             
@@ -1337,10 +1485,6 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
     def _cmd_updating(self, args) -> bool:
         """Activar o desactivar modo actualización para una aplicación"""
         try:
-            if not args.domain:
-                self._show_error("Debe especificar un dominio con --domain")
-                return False
-            
             # Determinar si activar o desactivar
             if args.enable and args.disable:
                 self._show_error("No puedes usar --enable y --disable al mismo tiempo")
@@ -1366,10 +1510,9 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
                 self.console.print(info_panel)
                 
                 # Preguntar si activar o desactivar
-                enable = Confirm.ask(
-                    "[yellow]¿Activar modo actualización?[/yellow] (No = desactivar)",
-                    default=True
-                )
+                enable = self._ask_enable("[yellow]¿Activar modo actualización?[/yellow] (No = desactivar)")
+                if enable is None:
+                    return False
             
             # Ejecutar comando
             action_text = "Activando" if enable else "Desactivando"
@@ -1379,12 +1522,16 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
             if success:
                 if enable:
                     self._show_success(f"✅ Modo actualización activado para {args.domain}")
-                    self.console.print(f"[dim]Los usuarios verán la página de actualización en https://{args.domain}[/dim]")
-                    self.console.print(f"[bold yellow]Para desactivar:[/bold yellow] webapp-manager updating --domain {args.domain} --disable")
+                    self.console.print(
+                        f"[dim]Los usuarios verán la página de actualización en https://{args.domain}[/dim]\n"
+                        f"[bold yellow]Para desactivar:[/bold yellow] webapp-manager updating --domain {args.domain} --disable"
+                    )
                 else:
                     self._show_success(f"✅ Modo actualización desactivado para {args.domain}")
-                    self.console.print(f"[dim]La aplicación está nuevamente accesible en https://{args.domain}[/dim]")
-                    self.console.print(f"[bold green]✓[/bold green] Configuración anterior restaurada desde backup")
+                    self.console.print(
+                        f"[dim]La aplicación está nuevamente accesible en https://{args.domain}[/dim]\n"
+                        "[bold green]✓[/bold green] Configuración anterior restaurada desde backup"
+                    )
             else:
                 self._show_error(f"❌ Error configurando modo actualización para {args.domain}")
             
@@ -1398,23 +1545,10 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
         """Sincronizar/actualizar páginas de mantenimiento en el servidor"""
         try:
             # Mostrar información
-            info_panel = Panel(
-                "[bold cyan]Sincronizar Páginas de Mantenimiento[/bold cyan]\n\n"
-                "Este comando actualiza las páginas HTML de mantenimiento en el servidor\n"
-                "copiándolas desde el repositorio a /apps/maintenance/\n\n"
-                "Páginas incluidas:\n"
-                "• [green]maintenance.html[/green] - Página de mantenimiento programado\n"
-                "• [green]updating.html[/green] - Página de actualización en progreso\n"
-                "• [green]error502.html[/green] - Página de error del servidor\n\n"
-                "[dim]Usa este comando después de actualizar webapp-manager para obtener\n"
-                "las últimas versiones de las páginas[/dim]",
-                title="ℹ️  Información",
-                style="blue"
-            )
-            self.console.print(info_panel)
+            self.console.print(_SYNC_PAGES_INFO_PANEL)
             
             # Confirmar
-            if not Confirm.ask("[yellow]¿Desea actualizar las páginas de mantenimiento?[/yellow]", default=True):
+            if not self._confirm("[yellow]¿Desea actualizar las páginas de mantenimiento?[/yellow]", default=True):
                 self._show_info("Operación cancelada")
                 return True
             
@@ -1423,19 +1557,7 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
                 success = self.manager.sync_maintenance_pages()
             
             if success:
-                success_panel = Panel(
-                    "[bold green]✅ Páginas de mantenimiento actualizadas[/bold green]\n\n"
-                    "Las páginas HTML se han copiado a /apps/maintenance/\n\n"
-                    "Ahora puedes:\n"
-                    "• Activar modo mantenimiento:\n"
-                    "  [cyan]webapp-manager maintenance --domain app.com[/cyan]\n\n"
-                    "• Activar modo actualización:\n"
-                    "  [cyan]webapp-manager updating --domain app.com[/cyan]\n\n"
-                    "[dim]Las páginas se sirven automáticamente cuando hay errores 502/503/504[/dim]",
-                    title="🎉 Completado",
-                    style="green"
-                )
-                self.console.print(success_panel)
+                self.console.print(_SYNC_PAGES_DONE_PANEL)
             else:
                 self._show_error("Error sincronizando páginas de mantenimiento")
             
@@ -1446,6 +1568,60 @@ Para ayuda detallada: [bold]webapp-manager --help[/bold]
             return False
 
 
+def _app_type(value: str) -> str:
+    """Validar --type; los deployers solo se importan si no es el tipo por defecto"""
+    if value == DEFAULT_APP_TYPE:
+        return value
+    from ..deployers import DeployerFactory
+    supported = DeployerFactory.get_supported_types()
+    if value not in supported:
+        raise argparse.ArgumentTypeError(
+            f"tipo no soportado: {value} (disponibles: {', '.join(supported)})"
+        )
+    return value
+
+
+def _split_domains(value: Optional[str]) -> List[str]:
+    """Separar --domain a,b,c en dominios, sin vacíos ni repetidos"""
+    if not value:
+        return []
+    return list(dict.fromkeys(part for part in (d.strip() for d in value.split(",")) if part))
+
+
+def _format_size(num_bytes: float) -> str:
+    """Formatear bytes como `free -h` (p. ej. 476Mi, 5.9Gi)"""
+    for unit in ("B", "Ki", "Mi", "Gi", "Ti"):
+        if num_bytes < 1024 or unit == "Ti":
+            break
+        num_bytes /= 1024
+    return f"{num_bytes:.1f}{unit}" if num_bytes < 10 and unit != "B" else f"{num_bytes:.0f}{unit}"
+
+
+def _disk_usage_percent(path: str) -> Optional[str]:
+    """Porcentaje de disco usado, calculado como la columna Use% de `df`"""
+    try:
+        usage = shutil.disk_usage(path)
+    except OSError:
+        return None
+    available = usage.used + usage.free
+    return f"{math.ceil(usage.used * 100 / available)}%" if available else None
+
+
+def _memory_usage() -> Optional[str]:
+    """Memoria usada/total leída de /proc/meminfo (como `free -h`)"""
+    try:
+        meminfo = {}
+        with open("/proc/meminfo") as f:
+            for line in f:
+                key, value = line.split(":", 1)
+                meminfo[key] = int(value.split()[0]) * 1024
+        total = meminfo["MemTotal"]
+        used = total - meminfo["MemAvailable"]
+    except (OSError, KeyError, ValueError):
+        return None
+    return f"{_format_size(used)}/{_format_size(total)}"
+
+
 def main():
     """Función de entrada principal para el comando webapp-manager"""
     try:
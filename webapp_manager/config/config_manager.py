@@ -2,18 +2,33 @@
 Gestión de configuración del sistema
 """
 
+import copy
 import json
 import logging
+import os
 import shutil
+import subprocess
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Set, Tuple
 
 from ..models import AppConfig, GlobalConfig
 from ..utils import Colors
 
+try:
+    import orjson
+except ImportError:  # orjson es opcional, se usa json de la stdlib
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Encoder único reutilizado cuando orjson no está disponible
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+# Nombre de los backups de configuración (formato strftime completo)
+BACKUP_NAME_FORMAT = "config-%Y%m%d-%H%M%S.json"
+
 
 class ConfigManager:
     """Gestor de configuración del sistema"""
@@ -21,15 +36,33 @@ class ConfigManager:
     def __init__(self, config_file: Path, backup_dir: Path):
         self.config_file = config_file
         self.backup_dir = backup_dir
+        # Última configuración leída y la clave (mtime_ns, tamaño) del archivo
+        self._cache: Optional[Dict] = None
+        self._cache_key: Optional[Tuple[int, int]] = None
+        # Índice puerto -> dominios, construido a partir de _cache
+        self._port_index: Dict[int, Set[str]] = {}
+        self._port_index_source: Optional[Dict] = None
         self._ensure_config_dir()
     
     def load_config(self) -> Dict:
         """Cargar configuración desde archivo JSON"""
+        return copy.deepcopy(self._load_cached())
+
+    def _load_cached(self) -> Dict:
+        """
+        Cargar configuración reutilizando la última lectura si el archivo
+        no cambió (mismo mtime y tamaño). El resultado es compartido: solo
+        lectura, usar load_config() para obtener una copia modificable.
+        """
         try:
             if self.config_file.exists():
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-                    return self._migrate_config(config)
+                stat = self.config_file.stat()
+                cache_key = (stat.st_mtime_ns, stat.st_size)
+                if cache_key != self._cache_key:
+                    config = _loads(self.config_file.read_bytes())
+                    self._cache = self._migrate_config(config)
+                    self._cache_key = cache_key
+                return self._cache
             
             # Configuración por defecto
             return {
@@ -44,20 +77,21 @@ class ConfigManager:
     def save_config(self, config: Dict):
         """Guardar configuración en archivo JSON"""
         try:
+            # Serializar primero: si falla no se toca nada en disco
+            data = _dumps(config)
+
             # Crear backup si existe configuración previa
             if self.config_file.exists():
-                backup_name = f"config-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
-                backup_path = self.backup_dir / backup_name
-                shutil.copy2(self.config_file, backup_path)
+                self._backup_config_file()
 
-            # Guardar nueva configuración
-            with open(self.config_file, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            # Guardar nueva configuración (archivo temporal + reemplazo atómico)
+            self._atomic_write(data)
 
             # Configurar permisos
-            import subprocess
-            subprocess.run(f"sudo chown root:root {self.config_file}", shell=True, check=False)
-            subprocess.run(f"sudo chmod 600 {self.config_file}", shell=True, check=False)
+            self._secure_config_file()
+
+            # La próxima lectura debe ver la configuración recién guardada
+            self._cache_key = None
 
         except Exception as e:
             print(Colors.error(f"Error guardando configuración: {e}"))
@@ -84,14 +118,14 @@ class ConfigManager:
 
     def get_app(self, domain: str) -> AppConfig:
         """Obtener configuración de aplicación"""
-        config = self.load_config()
+        config = self._load_cached()
         if domain in config["apps"]:
             try:
                 app_data = config["apps"][domain]
                 
                 # Asegurar que el dominio esté presente en los datos
                 if "domain" not in app_data:
-                    app_data["domain"] = domain
+                    app_data = {**app_data, "domain": domain}
                     
                 return AppConfig.from_dict(app_data)
             except Exception as e:
@@ -101,7 +135,7 @@ class ConfigManager:
 
     def get_all_apps(self) -> Dict[str, AppConfig]:
         """Obtener todas las aplicaciones"""
-        config = self.load_config()
+        config = self._load_cached()
         apps = {}
         
         if "apps" not in config or not config["apps"]:
@@ -112,7 +146,7 @@ class ConfigManager:
                 if isinstance(app_data, dict) and app_data:
                     # Asegurar que el dominio esté presente en los datos
                     if "domain" not in app_data:
-                        app_data["domain"] = domain
+                        app_data = {**app_data, "domain": domain}
                     apps[domain] = AppConfig.from_dict(app_data)
                 else:
                     logger.warning(f"Datos de aplicación inválidos para {domain}: {app_data}")
@@ -124,20 +158,31 @@ class ConfigManager:
 
     def app_exists(self, domain: str) -> bool:
         """Verificar si una aplicación existe"""
-        config = self.load_config()
+        config = self._load_cached()
         return domain in config["apps"]
 
     def is_port_in_use(self, port: int, exclude_domain: str = None) -> bool:
         """Verificar si un puerto está en uso"""
-        config = self.load_config()
-        for domain, app_data in config["apps"].items():
-            if domain != exclude_domain and app_data.get("port") == port:
-                return True
-        return False
+        domains = self._get_port_index().get(port)
+        if not domains:
+            return False
+        return any(domain != exclude_domain for domain in domains)
+
+    def _get_port_index(self) -> Dict[int, Set[str]]:
+        """Obtener el índice puerto -> dominios de la configuración actual"""
+        config = self._load_cached()
+        if self._port_index_source is not config:
+            index: Dict[int, Set[str]] = {}
+            for domain, app_data in config.get("apps", {}).items():
+                if isinstance(app_data, dict):
+                    index.setdefault(app_data.get("port"), set()).add(domain)
+            self._port_index = index
+            self._port_index_source = config
+        return self._port_index
 
     def get_global_config(self) -> GlobalConfig:
         """Obtener configuración global"""
-        config = self.load_config()
+        config = self._load_cached()
         return GlobalConfig.from_dict(config.get("global", {}))
 
     def update_global_config(self, global_config: GlobalConfig):
@@ -146,6 +191,48 @@ class ConfigManager:
         config["global"] = global_config.to_dict()
         self.save_config(config)
 
+    def _backup_config_file(self):
+        """
+        Respaldar la configuración actual. Como _atomic_write reemplaza el
+        archivo en lugar de reescribirlo, basta un hard link al inodo actual;
+        se copia solo si el enlace no es posible (p. ej. otro sistema de
+        archivos o un backup con el mismo nombre).
+        """
+        backup_path = self.backup_dir / datetime.now().strftime(BACKUP_NAME_FORMAT)
+        try:
+            os.link(self.config_file, backup_path)
+        except OSError:
+            shutil.copy2(self.config_file, backup_path)
+
+    def _atomic_write(self, data: bytes):
+        """Escribir la configuración sin dejar nunca un archivo a medias"""
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.config_file.parent, prefix=".config-", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.config_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _secure_config_file(self):
+        """Restringir el archivo de configuración a root (600)"""
+        try:
+            os.chmod(self.config_file, 0o600)
+            os.chown(self.config_file, 0, 0)
+        except OSError:
+            # Sin privilegios suficientes: delegar en sudo con una sola llamada
+            subprocess.run(
+                f"sudo chown root:root {self.config_file} && sudo chmod 600 {self.config_file}",
+                shell=True,
+                check=False
+            )
+
     def _ensure_config_dir(self):
         """Asegurar que el directorio de configuración existe"""
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
@@ -182,9 +269,8 @@ class ConfigManager:
     def export_config(self, export_path: Path) -> bool:
         """Exportar configuración a archivo"""
         try:
-            config = self.load_config()
-            with open(export_path, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            config = self._load_cached()
+            Path(export_path).write_bytes(_dumps(config))
             print(Colors.success(f"Configuración exportada a {export_path}"))
             return True
         except Exception as e:
@@ -194,8 +280,7 @@ class ConfigManager:
     def import_config(self, import_path: Path) -> bool:
         """Importar configuración desde archivo"""
         try:
-            with open(import_path, "r", encoding="utf-8") as f:
-                config = json.load(f)
+            config = _loads(Path(import_path).read_bytes())
             
             # Validar estructura básica
             if "apps" not in config:
@@ -213,3 +298,17 @@ class ConfigManager:
         except Exception as e:
             print(Colors.error(f"Error importando configuración: {e}"))
             return False
+
+
+def _dumps(config: Dict) -> bytes:
+    """Serializar configuración a JSON (UTF-8, indentado a 2 espacios)"""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return _JSON_ENCODER.encode(config).encode("utf-8")
+
+
+def _loads(data: bytes) -> Dict:
+    """Deserializar configuración JSON"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -3,6 +3,7 @@ Clase principal del WebApp Manager
 """
 
 import logging
+import math
 import os
 import shutil
 import sys
@@ -872,12 +873,15 @@ class WebAppManager:
             if not apps:
                 return []
 
+            # Estado actual de todos los servicios con una sola consulta
+            states = self.systemd_service.get_active_states(list(apps))
+
             # Convertir el diccionario a lista y actualizar el estado
             app_list = []
             for domain, app_config in apps.items():
                 try:
                     # Actualizar estado actual
-                    app_config.status = self.systemd_service.get_service_status(domain)
+                    app_config.status = self.systemd_service.format_status(states[domain])
                     app_list.append(app_config)
                 except Exception as e:
                     logger.error(f"Error al procesar aplicación {domain}: {e}")
@@ -920,13 +924,13 @@ class WebAppManager:
                 if self.verbose:
                     print(f"\n{Colors.bold('📊 Nginx Access Log (últimas 20 líneas):')}")
                     print("-" * 80)
-                self.cmd.run(f"tail -n 20 {nginx_access}", capture_output=False)
+                _print_tail(nginx_access, 20)
 
             if os.path.exists(nginx_error) and os.path.getsize(nginx_error) > 0:
                 if self.verbose:
                     print(f"\n{Colors.bold('⚠️ Nginx Error Log (últimas 20 líneas):')}")
                     print("-" * 80)
-                self.cmd.run(f"tail -n 20 {nginx_error}", capture_output=False)
+                _print_tail(nginx_error, 20)
 
             return True
 
@@ -1013,7 +1017,8 @@ class WebAppManager:
                 print(Colors.success("Servicio activo"))
 
         # Verificar puerto
-        port_check = self.cmd.run_sudo(f'netstat -tlnp | grep :{app_config.port}', check=False)
+        listening = self.cmd.run_sudo("netstat -tlnp", check=False) or ""
+        port_check = any(f":{app_config.port}" in line for line in listening.splitlines())
         if not port_check:
             issues.append(f"❌ Puerto {app_config.port} no está escuchando")
         else:
@@ -1029,7 +1034,7 @@ class WebAppManager:
                 print(Colors.success("Configuración nginx existe"))
 
         # Verificar conectividad
-        if not self.app_service.test_connectivity(domain, app_config.port):
+        if not self.app_service.test_connectivity(domain, app_config.port, wait=0):
             issues.append(f"❌ Aplicación no responde en puerto {app_config.port}")
         else:
             if self.verbose:
@@ -1073,8 +1078,13 @@ class WebAppManager:
                 print(Colors.success("Configuración nginx válida"))
 
         # Verificar espacio en disco
-        disk_usage = self.cmd.run("df / | awk 'NR==2{print $5}' | sed 's/%//'", check=False)
-        if disk_usage and int(disk_usage) > 90:
+        try:
+            usage = shutil.disk_usage("/")
+            # Mismo redondeo que la columna Use% de df
+            disk_usage = math.ceil(usage.used * 100 / (usage.used + usage.free))
+        except (OSError, ZeroDivisionError):
+            disk_usage = None
+        if disk_usage and disk_usage > 90:
             issues.append(f"❌ Poco espacio en disco: {disk_usage}% usado")
         else:
             if self.verbose:
@@ -1192,7 +1202,7 @@ class WebAppManager:
         print(f"SSL: {'Configurado' if app_config.ssl else 'No configurado'}")
         
         # Verificar conectividad
-        connectivity = self.app_service.test_connectivity(domain, app_config.port)
+        connectivity = self.app_service.test_connectivity(domain, app_config.port, wait=0)
         print(f"Conectividad: {'🟢 Activo' if connectivity else '🔴 No responde'}")
         
         return True
@@ -1420,3 +1430,19 @@ class WebAppManager:
                 import traceback
                 print(Colors.error(f"Detalles: {traceback.format_exc()}"))
             return False
+
+
+def _print_tail(path: str, count: int, block_size: int = 8192):
+    """Imprimir las últimas líneas de un archivo (como `tail -n`), leyendo bloques desde el final"""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        while pos > 0 and data.count(b"\n") <= count:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = data.decode("utf-8", errors="replace").splitlines()[-count:]
+    if lines:
+        print("\n".join(lines), flush=True)
@@ -2,6 +2,10 @@
 Factory para crear deployers específicos según el tipo de aplicación
 """
 
+import os
+from functools import lru_cache
+from typing import Set, Tuple
+
 from .base_deployer import BaseDeployer
 from .nextjs_deployer import NextJSDeployer
 from .fastapi_deployer import FastAPIDeployer
@@ -41,12 +45,14 @@ class DeployerFactory:
         from pathlib import Path
         
         app_path = Path(app_dir)
+        # Una sola lectura del directorio para todas las comprobaciones
+        names = cls._scan_names(app_path)
         
         # Verificar archivos específicos para cada tipo
-        if (app_path / "next.config.js").exists() or (app_path / "next.config.mjs").exists():
+        if "next.config.js" in names or "next.config.mjs" in names:
             return "nextjs"
         
-        if (app_path / "main.py").exists():
+        if "main.py" in names:
             # Verificar si es FastAPI
             try:
                 with open(app_path / "main.py", "r") as f:
@@ -56,7 +62,7 @@ class DeployerFactory:
             except:
                 pass
         
-        if (app_path / "package.json").exists():
+        if "package.json" in names:
             try:
                 import json
                 with open(app_path / "package.json", "r") as f:
@@ -83,12 +89,27 @@ class DeployerFactory:
                 pass
         
         # Si solo tiene index.html, es estático
-        if (app_path / "index.html").exists():
+        if "index.html" in names:
             return "static"
         
         # Por defecto, retornar estático
         return "static"
     
+    @staticmethod
+    def _scan_names(app_dir) -> Set[str]:
+        """Nombres de las entradas de un directorio (vacío si no se puede leer)"""
+        try:
+            with os.scandir(app_dir) as entries:
+                return {entry.name for entry in entries}
+        except OSError:
+            return set()
+    
+    @classmethod
+    def detect_and_validate(cls, app_dir: str) -> Tuple[str, bool]:
+        """Detectar el tipo de aplicación y validar el directorio para ese tipo"""
+        app_type = cls.detect_app_type(app_dir)
+        return app_type, cls.validate_app_type(app_dir, app_type)
+    
     @classmethod
     def validate_app_type(cls, app_dir: str, app_type: str) -> bool:
         """Validar que el tipo de aplicación es correcto para el directorio"""
@@ -96,10 +117,7 @@ class DeployerFactory:
             return False
         
         try:
-            from ..services.cmd_service import CmdService
-            cmd_service = CmdService()
-            
-            deployer = cls.create_deployer(app_type, "/tmp", cmd_service)
+            deployer = cls._get_probe_deployer(app_type)
             from pathlib import Path
             return deployer.validate_structure(Path(app_dir))
             
@@ -108,18 +126,27 @@ class DeployerFactory:
             return False
     
     @classmethod
+    @lru_cache(maxsize=None)
+    def _get_probe_deployer(cls, app_type: str) -> BaseDeployer:
+        """Instancia compartida (sobre /tmp) para consultas que no despliegan"""
+        from ..services.cmd_service import CmdService
+        return cls.create_deployer(app_type, "/tmp", CmdService())
+    
+    @classmethod
+    @lru_cache(maxsize=None)
     def get_deployer_info(cls, app_type: str) -> dict:
-        """Obtener información sobre un deployer específico"""
+        """
+        Obtener información sobre un deployer específico
+        El resultado se cachea y es compartido: no modificarlo
+        """
         if app_type not in cls._deployers:
             return {}
         
         deployer_class = cls._deployers[app_type]
         
-        # Crear instancia temporal para obtener información
+        # Instancia de consulta para obtener información
         try:
-            from ..services.cmd_service import CmdService
-            cmd_service = CmdService()
-            deployer = deployer_class("/tmp", cmd_service)
+            deployer = cls._get_probe_deployer(app_type)
             
             return {
                 "type": app_type,
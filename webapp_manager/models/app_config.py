@@ -2,12 +2,20 @@
 Modelos de datos para WebApp Manager
 """
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import Dict, Optional
 
+# Campos obligatorios de AppConfig (orden usado en los mensajes de error)
+_REQUIRED_FIELDS_ORDER = ('domain', 'port', 'app_type', 'source', 'branch', 'ssl', 'created')
+_REQUIRED_FIELDS = frozenset(_REQUIRED_FIELDS_ORDER)
 
-@dataclass
+# __slots__ para los modelos más instanciados (dataclass(slots=...) requiere Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class AppConfig:
     """Configuración de una aplicación web"""
     domain: str
@@ -98,31 +106,20 @@ class AppConfig:
             raise ValueError("Datos inválidos: se esperaba un diccionario no vacío")
         
         # Validar campos requeridos
-        required_fields = ['domain', 'port', 'app_type', 'source', 'branch', 'ssl', 'created']
-        missing_fields = []
-        for field in required_fields:
-            if field not in data or data[field] is None:
-                missing_fields.append(field)
+        missing_fields = _REQUIRED_FIELDS.difference(
+            key for key, value in data.items() if value is not None
+        )
         
         if missing_fields:
-            raise ValueError(f"Campo requerido faltante: {', '.join(missing_fields)}")
-        
-        # Asegurar valores por defecto
-        defaults = {
-            'last_updated': data.get('last_updated', data.get('created', '')),
-            'status': data.get('status', 'unknown'),
-            'build_command': data.get('build_command', ''),
-            'start_command': data.get('start_command', ''),
-            'env_vars': data.get('env_vars', {})
-        }
-        
-        # Combinar datos con defaults
-        config_data = {**data, **defaults}
+            missing = [name for name in _REQUIRED_FIELDS_ORDER if name in missing_fields]
+            raise ValueError(f"Campo requerido faltante: {', '.join(missing)}")
         
-        return cls(**config_data)
+        # Los campos opcionales ausentes toman los defaults del dataclass
+        # (__post_init__ completa last_updated); se ignoran claves desconocidas
+        return cls(**{key: value for key, value in data.items() if key in _APP_CONFIG_FIELDS})
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GlobalConfig:
     """Configuración global del sistema"""
     default_ssl: bool = True
@@ -148,7 +145,12 @@ class GlobalConfig:
     @classmethod
     def from_dict(cls, data: dict) -> 'GlobalConfig':
         """Crear instancia desde diccionario"""
-        return cls(**data)
+        return cls(**{key: value for key, value in data.items() if key in _GLOBAL_CONFIG_FIELDS})
+
+
+# Nombres de campo calculados una sola vez para from_dict
+_APP_CONFIG_FIELDS = frozenset(f.name for f in fields(AppConfig))
+_GLOBAL_CONFIG_FIELDS = frozenset(f.name for f in fields(GlobalConfig))
 
 
 @dataclass
@@ -2,8 +2,11 @@
 Servicio para gestión de aplicaciones
 """
 
+import http.client
 import json
 import shutil
+import socket
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -12,6 +15,10 @@ from ..utils import CommandRunner, Colors, Validators, Logger
 from ..models import AppConfig
 from .cmd_service import CmdService
 
+# Límites (segundos) de la prueba de conectividad
+CONNECT_TIMEOUT = 1.0
+HTTP_TIMEOUT = 5.0
+
 
 class AppService:
     """Servicio para gestión de aplicaciones"""
@@ -252,24 +259,41 @@ class AppService:
             print(Colors.error(f"Error removiendo aplicación: {e}"))
             return False
 
-    def test_connectivity(self, domain: str, port: int) -> bool:
-        """Probar conectividad de la aplicación"""
+    def test_connectivity(self, domain: str, port: int, wait: float = 3) -> bool:
+        """
+        Probar conectividad de la aplicación con una petición HTTP local
+        
+        Args:
+            domain: Dominio de la aplicación
+            port: Puerto interno de la aplicación
+            wait: Segundos de espera previa para que el servicio arranque
+                  (0 para consultar el estado de un servicio ya en marcha)
+        """
         try:
-            import time
-            time.sleep(3)
+            if wait:
+                time.sleep(wait)
 
-            test_result = self.cmd.run(
-                f'curl -s -o /dev/null -w "%{{http_code}}" http://localhost:{port}',
-                check=False,
-            )
+            # Comprobación TCP acotada: si nada escucha, falla al instante
+            with socket.create_connection(("localhost", port), timeout=CONNECT_TIMEOUT):
+                pass
+
+            conn = http.client.HTTPConnection("localhost", port, timeout=HTTP_TIMEOUT)
+            try:
+                conn.request("GET", "/")
+                status_code = conn.getresponse().status
+            finally:
+                conn.close()
 
-            if test_result and test_result.startswith(("2", "3")):
+            if 200 <= status_code < 400:
                 print(Colors.success("Aplicación responde correctamente"))
                 return True
             else:
-                print(Colors.warning(f"Aplicación no responde (código: {test_result})"))
+                print(Colors.warning(f"Aplicación no responde (código: {status_code})"))
                 return False
 
+        except OSError as e:
+            print(Colors.warning(f"Aplicación no responde en puerto {port}: {e}"))
+            return False
         except Exception as e:
             print(Colors.warning(f"Error probando conectividad: {e}"))
             return False
@@ -1222,12 +1246,9 @@ class AppService:
                 print(Colors.info(f"🔧 Configurando directorio Git seguro: {directory}"))
             
             # Configurar directorio como seguro para Git (sin sudo porque ya somos root)
-            result = self.cmd.run(
-                f"git config --global --get-all safe.directory | grep -x {directory}",
-                check=False,
-            )
+            result = self.cmd.run("git config --global --get-all safe.directory", check=False)
 
-            if not result or str(directory) not in result:
+            if not result or str(directory) not in result.splitlines():
                 self.cmd.run(f"git config --global --add safe.directory {directory}")
                 if self.verbose:
                     print(Colors.success(f"✅ Directorio {directory} configurado como seguro para Git"))
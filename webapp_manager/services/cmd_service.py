@@ -2,11 +2,14 @@
 Servicio para ejecutar comandos del sistema
 """
 
+import shutil
 import subprocess
 import sys
 import os
 from typing import Optional
 
+from ..utils.command_runner import CLOSE_FDS
+
 
 class CmdService:
     """Servicio para ejecutar comandos del sistema"""
@@ -42,6 +45,7 @@ class CmdService:
                 result = subprocess.run(
                     command,
                     shell=True,
+                    close_fds=CLOSE_FDS,
                     capture_output=True,
                     text=True,
                     encoding=self.encoding,
@@ -68,6 +72,7 @@ class CmdService:
                 result = subprocess.run(
                     command,
                     shell=True,
+                    close_fds=CLOSE_FDS,
                     timeout=timeout,
                     check=check
                 )
@@ -143,12 +148,9 @@ class CmdService:
             print(f"🔍 Verificando si existe comando: {command}")
         
         try:
-            if os.name == 'nt':  # Windows
-                result = self.run(f"where {command}", check=False, show_command=False)
-            else:  # Unix/Linux
-                result = self.run(f"command -v {command}", check=False, show_command=False)
-            
-            exists = result is not None and result.strip() != ""
+            # Buscar en PATH sin lanzar un shell por cada comando
+            result = shutil.which(command)
+            exists = result is not None
             
             if self.logger:
                 if exists:
@@ -181,7 +183,7 @@ class CmdService:
             Código de salida
         """
         try:
-            return subprocess.run(command, shell=True).returncode
+            return subprocess.run(command, shell=True, close_fds=CLOSE_FDS).returncode
         except Exception:
             return 1
     
@@ -199,6 +201,7 @@ class CmdService:
             return subprocess.Popen(
                 command,
                 shell=True,
+                close_fds=CLOSE_FDS,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True
@@ -2,7 +2,9 @@
 Servicio para gestión de configuraciones nginx
 """
 
+import os
 import shutil
+import signal
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -18,6 +20,10 @@ from ..models import AppConfig
 from .cmd_service import CmdService
 
 
+# Ubicaciones habituales del PID del proceso maestro de nginx
+NGINX_PID_FILES = (Path("/run/nginx.pid"), Path("/var/run/nginx.pid"))
+
+
 class NginxService:
     """Servicio para gestión de nginx"""
     
@@ -31,28 +37,11 @@ class NginxService:
     def create_config(self, app_config: AppConfig) -> bool:
         """Crear configuración nginx para aplicación"""
         try:
-            config_content = self._get_nginx_config_content(app_config)
-            config_path = self.nginx_sites / app_config.domain
-            temp_config_path = self.nginx_sites / f"{app_config.domain}.temp"
-
-            # Escribir configuración temporal
-            with open(temp_config_path, "w") as f:
-                f.write(config_content)
-
-            # Validar configuración nginx
-            print(Colors.info("Validando configuración nginx..."))
-            test_result = self.cmd.run_sudo("nginx -t 2>&1", check=False)
-
-            if test_result and ("syntax is ok" not in test_result or "test is successful" not in test_result):
-                print(Colors.warning(f"Problemas en configuración nginx: {test_result}"))
-
-            # Mover configuración temporal a definitiva
-            shutil.move(temp_config_path, config_path)
-
-            # Habilitar sitio
-            self._enable_site(app_config.domain)
+            # Escribir la configuración (temporal + reemplazo) y habilitar sitio
+            self.write_config(app_config)
 
             # Validar configuración final
+            print(Colors.info("Validando configuración nginx..."))
             final_test = self.cmd.run_sudo("nginx -t 2>&1", check=False)
             if final_test and "syntax is ok" in final_test and "test is successful" in final_test:
                 print(Colors.success(f"Configuración nginx creada para {app_config.domain}"))
@@ -63,11 +52,26 @@ class NginxService:
 
         except Exception as e:
             print(Colors.error(f"Error creando configuración nginx: {e}"))
-            temp_config = self.nginx_sites / f"{app_config.domain}.temp"
-            if temp_config.exists():
-                temp_config.unlink()
             return False
 
+    def write_config(self, app_config: AppConfig):
+        """
+        Escribir y habilitar la configuración nginx de una aplicación sin
+        validarla ni mostrar mensajes. `nginx -t` comprueba todos los sitios a
+        la vez: tras escribir una o varias, validar una sola vez con
+        test_config() antes de recargar. Lanza OSError si no se pudo escribir
+        (el archivo temporal se elimina).
+        """
+        config_path = self.nginx_sites / app_config.domain
+        temp_config_path = self.nginx_sites / f"{app_config.domain}.temp"
+        try:
+            temp_config_path.write_text(self._get_nginx_config_content(app_config))
+            os.replace(temp_config_path, config_path)
+        except BaseException:
+            temp_config_path.unlink(missing_ok=True)
+            raise
+        self._enable_site(app_config.domain)
+
     def remove_config(self, domain: str) -> bool:
         """Remover configuración nginx"""
         try:
@@ -88,12 +92,29 @@ class NginxService:
 
     def reload(self) -> bool:
         """Recargar nginx"""
+        # Vía rápida: SIGHUP al proceso maestro (lo mismo que `nginx -s reload`)
+        if self._signal_master(signal.SIGHUP):
+            return True
         try:
             result = self.cmd.run_sudo("systemctl reload nginx", check=False)
             return result is not None
         except Exception:
             return False
 
+    def _signal_master(self, sig: int) -> bool:
+        """Enviar una señal al proceso maestro de nginx según su archivo PID"""
+        for pid_file in NGINX_PID_FILES:
+            try:
+                pid = int(pid_file.read_text().strip())
+                # Evitar señalizar otro proceso si el PID quedó obsoleto
+                if not Path(f"/proc/{pid}/comm").read_text().startswith("nginx"):
+                    continue
+                os.kill(pid, sig)
+                return True
+            except (OSError, ValueError):
+                continue
+        return False
+
     def test_config(self) -> bool:
         """Probar configuración nginx"""
         try:
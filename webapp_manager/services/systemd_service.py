@@ -5,7 +5,7 @@ Servicio para gestión de servicios systemd
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from ..utils import CommandRunner, Colors
 from ..models import AppConfig
@@ -109,23 +109,60 @@ class SystemdService:
 
     def get_service_status(self, domain: str) -> str:
         """Obtener estado del servicio"""
-        try:
-            status = self.cmd.run_sudo(f"systemctl is-active {domain}.service", check=False)
-            
-            if status == "active":
-                return f"{Colors.GREEN}🟢 Activo{Colors.END}"
-            elif status == "inactive":
-                return f"{Colors.RED}🔴 Inactivo{Colors.END}"
-            elif status == "failed":
-                return f"{Colors.RED}❌ Fallido{Colors.END}"
-            elif status:
-                return f"{Colors.YELLOW}🟡 {status.title()}{Colors.END}"
-            else:
-                return f"{Colors.YELLOW}🟡 Desconocido{Colors.END}"
+        return self.format_status(self.get_active_state(domain))
 
+    def get_active_state(self, domain: str) -> str:
+        """Obtener el estado crudo de systemd ("active", "failed", ...) o "" si no se pudo consultar"""
+        try:
+            return self.cmd.run_sudo(f"systemctl is-active {domain}.service", check=False) or ""
         except Exception:
+            return ""
+
+    @staticmethod
+    def format_status(status: Optional[str]) -> str:
+        """Convertir un estado de systemd ("active", "failed", ...) en texto para mostrar"""
+        if status == "active":
+            return f"{Colors.GREEN}🟢 Activo{Colors.END}"
+        elif status == "inactive":
+            return f"{Colors.RED}🔴 Inactivo{Colors.END}"
+        elif status == "failed":
+            return f"{Colors.RED}❌ Fallido{Colors.END}"
+        elif status:
+            return f"{Colors.YELLOW}🟡 {status.title()}{Colors.END}"
+        else:
             return f"{Colors.YELLOW}🟡 Desconocido{Colors.END}"
 
+    def get_active_states(self, domains: List[str]) -> Dict[str, str]:
+        """
+        Obtener el estado de varios servicios con una sola llamada a systemctl
+        Returns: {dominio: estado} con el valor crudo de systemd ("active",
+        "inactive", "failed", ...) o "" si no se pudo consultar (para todos,
+        si systemctl no devolvió exactamente un estado por unidad)
+        """
+        return dict(zip(domains, self.get_active_state_list(domains)))
+
+    def get_active_state_list(self, names: List[str]) -> List[str]:
+        """
+        Como get_active_states, pero devuelve los estados en el orden de
+        names (cada nombre se consulta como <nombre>.service). Permite
+        consultar en la misma llamada unidades que no son aplicaciones, como
+        "nginx", sin que choquen con un dominio de igual nombre.
+        """
+        if not names:
+            return []
+        try:
+            units = " ".join(f"{name}.service" for name in names)
+            output = self.cmd.run_sudo(f"systemctl is-active {units}", check=False)
+            # systemctl imprime un estado por unidad, en el mismo orden
+            states = output.splitlines() if output else []
+        except Exception:
+            states = []
+        if len(states) != len(names):
+            # Salida parcial o con otro formato: no se puede saber qué línea
+            # corresponde a cada unidad, así que ningún estado es fiable
+            return [""] * len(names)
+        return states
+
     def is_service_active(self, domain: str) -> bool:
         """Verificar si el servicio está activo"""
         try:
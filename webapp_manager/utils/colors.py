@@ -26,28 +26,35 @@ class Colors:
     END = "\033[0m"
     ENDC = "\033[0m"
     
+    # Prefijos precalculados para los mensajes legacy
+    _SUCCESS_PREFIX = f"{GREEN}✅ "
+    _ERROR_PREFIX = f"{RED}❌ "
+    _WARNING_PREFIX = f"{YELLOW}⚠️  "
+    _INFO_PREFIX = f"{BLUE}ℹ️  "
+    _HEADER_SEPARATOR = f"{BOLD}{CYAN}{'═' * 80}{END}"
+    
     # Console global para uso en toda la aplicación
     console = Console()
     
     @classmethod
     def success(cls, text: str) -> str:
         """Texto de éxito en verde - compatibilidad legacy"""
-        return f"{cls.GREEN}✅ {text}{cls.END}"
+        return f"{cls._SUCCESS_PREFIX}{text}{cls.END}"
     
     @classmethod
     def error(cls, text: str) -> str:
         """Texto de error en rojo - compatibilidad legacy"""
-        return f"{cls.RED}❌ {text}{cls.END}"
+        return f"{cls._ERROR_PREFIX}{text}{cls.END}"
     
     @classmethod
     def warning(cls, text: str) -> str:
         """Texto de advertencia en amarillo - compatibilidad legacy"""
-        return f"{cls.YELLOW}⚠️  {text}{cls.END}"
+        return f"{cls._WARNING_PREFIX}{text}{cls.END}"
     
     @classmethod
     def info(cls, text: str) -> str:
         """Texto informativo en azul - compatibilidad legacy"""
-        return f"{cls.BLUE}ℹ️  {text}{cls.END}"
+        return f"{cls._INFO_PREFIX}{text}{cls.END}"
     
     @classmethod
     def step(cls, step: int, total: int, text: str) -> str:
@@ -59,10 +66,9 @@ class Colors:
     @classmethod
     def header(cls, text: str) -> str:
         """Crear encabezado moderno"""
-        separator = "═" * 80
-        return f"""{cls.BOLD}{cls.CYAN}{separator}{cls.END}
+        return f"""{cls._HEADER_SEPARATOR}
 {cls.BOLD}{cls.CYAN}{text.center(80)}{cls.END}
-{cls.BOLD}{cls.CYAN}{separator}{cls.END}"""
+{cls._HEADER_SEPARATOR}"""
     
     @classmethod
     def bold(cls, text: str) -> str:
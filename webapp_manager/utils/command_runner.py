@@ -3,12 +3,18 @@ Utilidades para ejecutar comandos del sistema
 """
 
 import logging
+import shutil
 import subprocess
 import sys
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Sin close_fds: los descriptores de Python no se heredan (PEP 446) y
+# subprocess puede lanzar el proceso con posix_spawn en vez de fork+exec
+# (compartido con services.cmd_service)
+CLOSE_FDS = False
+
 
 class CommandRunner:
     """Ejecutor de comandos del sistema"""
@@ -39,6 +45,7 @@ class CommandRunner:
                 result = subprocess.run(
                     command,
                     shell=True,
+                    close_fds=CLOSE_FDS,
                     capture_output=True,
                     text=True,
                     check=check,
@@ -55,6 +62,7 @@ class CommandRunner:
                 result = subprocess.run(
                     command, 
                     shell=True, 
+                    close_fds=CLOSE_FDS,
                     check=check, 
                     timeout=timeout
                 )
@@ -99,8 +107,7 @@ class CommandRunner:
         """
         Verificar si un comando existe en el sistema
         """
-        result = CommandRunner.run(f"command -v {command}", check=False)
-        return result is not None and result != ""
+        return shutil.which(command) is not None
 
 
 class CommandExecutionError(Exception):
@@ -7,7 +7,7 @@ Con barra de progreso ANCLADA al bottom
 import time
 from typing import Optional, Dict, Any, List
 from contextlib import contextmanager
-from rich.console import Console, Group, RenderableType
+from rich.console import Console, Group
 from rich.progress import (
     Progress,
     SpinnerColumn,
@@ -17,10 +17,7 @@ from rich.progress import (
     TimeRemainingColumn,
 )
 from rich.live import Live
-from rich.panel import Panel
 from rich.text import Text
-from rich.layout import Layout
-from rich.console import Group
 
 
 class ProgressManager:
@@ -3,20 +3,33 @@ Utilidades para validación de datos
 """
 
 import re
+from functools import lru_cache
 from typing import Union
 
+# Patrones compilados una sola vez al importar el módulo
+_DOMAIN_RE = re.compile(
+    r"^[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)*$"
+)
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_ENV_KEY_RE = re.compile(r"^[A-Z_][A-Z0-9_]*$")
+# Patrones no permitidos en nombres de rama, combinados en una sola expresión:
+# empezar con punto, doble punto, caracteres especiales, backslash o espacios
+_INVALID_BRANCH_RE = re.compile(r"^\.|\.\.|[@{~^:]|\\|\s")
+
+_VALID_APP_TYPES = frozenset(("nextjs", "node", "static", "fastapi"))
+
 
 class Validators:
     """Validadores de datos comunes"""
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def validate_domain(domain: str) -> bool:
         """Validar formato de dominio"""
         if not domain or len(domain) > 253:
             return False
         
-        pattern = r"^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)*$"
-        return bool(re.match(pattern, domain))
+        return _DOMAIN_RE.match(domain) is not None
     
     @staticmethod
     def validate_port(port: Union[int, str]) -> bool:
@@ -30,8 +43,7 @@ class Validators:
     @staticmethod
     def validate_app_type(app_type: str) -> bool:
         """Validar tipo de aplicación"""
-        valid_types = ["nextjs", "node", "static", "fastapi"]
-        return app_type in valid_types
+        return app_type in _VALID_APP_TYPES
     
     @staticmethod
     def validate_branch_name(branch: str) -> bool:
@@ -39,20 +51,7 @@ class Validators:
         if not branch or len(branch) > 255:
             return False
         
-        # Patrones no permitidos en nombres de rama
-        invalid_patterns = [
-            r"^\.",      # No puede empezar con punto
-            r"\.\.",     # No puede contener doble punto
-            r"[@{~^:]",  # Caracteres especiales no permitidos
-            r"\\",       # No puede contener backslash
-            r"\s",       # No puede contener espacios
-        ]
-        
-        for pattern in invalid_patterns:
-            if re.search(pattern, branch):
-                return False
-        
-        return True
+        return _INVALID_BRANCH_RE.search(branch) is None
     
     @staticmethod
     def validate_email(email: str) -> bool:
@@ -60,8 +59,7 @@ class Validators:
         if not email:
             return False
         
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return bool(re.match(pattern, email))
+        return _EMAIL_RE.match(email) is not None
     
     @staticmethod
     def validate_env_var(env_var: str) -> tuple[bool, str, str]:
@@ -77,7 +75,7 @@ class Validators:
         value = value.strip()
         
         # Validar clave
-        if not key or not re.match(r"^[A-Z_][A-Z0-9_]*$", key):
+        if not key or not _ENV_KEY_RE.match(key):
             return False, key, value
         
         return True, key, value